@@ -20,21 +20,27 @@ High-performance compiled implementations for column operations.
 from ossis.compute.compiled import calculate_data_width
 from ossis.compute.compiled import collect_cython
 from ossis.compute.compiled import extract_dict_columns
+from ossis.compute.compiled import extract_dict_columns_batch
 from ossis.compute.compiled import from_bytes_cython
 from ossis.compute.compiled import process_table
 from ossis.compute.compiled import parse_float16
+from ossis.compute.compiled import parse_float16_array
 from ossis.compute.compiled import parse_float32
+from ossis.compute.compiled import parse_float32_array
 from ossis.compute.compiled import parse_float64
 
 __all__ = [
     # From compiled module
     "from_bytes_cython",
     "extract_dict_columns",
+    "extract_dict_columns_batch",
     "collect_cython",
     "calculate_data_width",
     "process_table",
     "parse_float16",
+    "parse_float16_array",
     "parse_float32",
+    "parse_float32_array",
     "parse_float64",
 ]
 
@@ -31,8 +31,10 @@ cimport numpy as cnp
 from numpy cimport ndarray
 from libc.stdint cimport int32_t, int64_t
 from cpython.dict cimport PyDict_GetItem
+from cpython.list cimport PyList_New, PyList_SET_ITEM
 from cpython.tuple cimport PyTuple_New, PyTuple_SET_ITEM
 from cpython.object cimport PyObject
+from cpython.ref cimport Py_INCREF
 from libc.stdint cimport uint16_t, uint32_t
 from libc.string cimport memcpy
 
@@ -91,13 +93,53 @@ cpdef tuple extract_dict_columns(dict data, tuple fields):
     """
     cdef Py_ssize_t i, num_fields = len(fields)
     cdef PyObject* value_ptr
-    cdef list field_data = [None] * num_fields
+    cdef object value
+    cdef tuple field_data = PyTuple_New(num_fields)
 
+    # fill the tuple directly rather than building a list and copying it
     for i in range(num_fields):
         value_ptr = PyDict_GetItem(data, fields[i])
-        (<list>field_data)[i] = <object>value_ptr if value_ptr is not NULL else None
+        value = <object>value_ptr if value_ptr is not NULL else None
+        Py_INCREF(value)  # PyTuple_SET_ITEM steals a reference
+        PyTuple_SET_ITEM(field_data, i, value)
+
+    return field_data
 
-    return tuple(field_data)
+
+cpdef list extract_dict_columns_batch(list rows, tuple fields):
+    """
+    Extracts the given fields from each dictionary in a list, the batch form of
+    `extract_dict_columns`.
+
+    Parameters:
+        rows: list
+            The dictionaries to extract fields from.
+        fields: tuple
+            The field names to extract.
+
+    Returns:
+        A list of tuples, one per dictionary, in the order of the fields.
+        Missing fields will have None.
+    """
+    cdef Py_ssize_t i, j, num_rows = len(rows), num_fields = len(fields)
+    cdef PyObject* value_ptr
+    cdef object value
+    cdef dict data
+    cdef tuple field_data
+    cdef list result = PyList_New(num_rows)
+
+    for i in range(num_rows):
+        data = <dict?>rows[i]
+        field_data = PyTuple_New(num_fields)
+        for j in range(num_fields):
+            value_ptr = PyDict_GetItem(data, fields[j])
+            value = <object>value_ptr if value_ptr is not NULL else None
+            Py_INCREF(value)  # PyTuple_SET_ITEM steals a reference
+            PyTuple_SET_ITEM(field_data, j, value)
+        Py_INCREF(field_data)  # PyList_SET_ITEM steals a reference
+        PyList_SET_ITEM(result, i, field_data)
+
+    return result
 
 
 cpdef cnp.ndarray collect_cython(list rows, int32_t[:] columns, int limit=-1):
@@ -511,3 +553,29 @@ def parse_float64(object x, **kwargs) -> float:
     Python float is IEEE-754 binary64 already.
     """
     return float(x)
+
+
+def parse_float16_array(values) -> list:
+    """
+    Quantize a 1-D array of numbers to float16 precision, as parse_float16 does for
+    each element, returning a list of Python floats.
+    """
+    cdef const double[::1] data = np.ascontiguousarray(values, dtype=np.float64)
+    cdef Py_ssize_t i, n = data.shape[0]
+    cdef list result = [None] * n
+    for i in range(n):
+        result[i] = <double>_half_bits_to_float32(_float32_to_half_bits(<float>data[i]))
+    return result
+
+
+def parse_float32_array(values) -> list:
+    """
+    Quantize a 1-D array of numbers to float32 precision, as parse_float32 does for
+    each element, returning a list of Python floats.
+    """
+    cdef const double[::1] data = np.ascontiguousarray(values, dtype=np.float64)
+    cdef Py_ssize_t i, n = data.shape[0]
+    cdef list result = [None] * n
+    for i in range(n):
+        result[i] = <double><float>data[i]
+    return result
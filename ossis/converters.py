@@ -163,6 +163,36 @@ def from_arrow(tables, size=None):
     return rows_iterator, ossis_schema
 
 
+def to_ipc(dataset, size=None) -> bytes:
+    """
+    Serialize a dataset to the Arrow IPC stream format, writing the whole
+    table in one go rather than serializing each row.
+    """
+    table = to_arrow(dataset, size=size)
+
+    sink = _pyarrow.BufferOutputStream()
+    with _pyarrow.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def from_ipc(values, size=None):
+    """
+    Read an Arrow IPC stream, as written by `to_ipc`, back into rows.
+    """
+    global _pyarrow
+    if _pyarrow is None:
+        try:
+            import pyarrow
+
+            _pyarrow = pyarrow
+        except ImportError as import_error:
+            raise MissingDependencyError(import_error.name) from import_error
+
+    table = _pyarrow.ipc.open_stream(values).read_all()
+    return from_arrow(table, size=size)
+
+
 def to_pandas(dataset, size=None):
     """wrap the arrow function to convert to pandas"""
     return dataset.arrow(size).to_pandas()
@@ -135,6 +135,23 @@ class DataFrame:
 
         return to_arrow(self, size=size)
 
+    @classmethod
+    def from_ipc(cls, data):
+        """Create an ossis DataFrame from bytes in the Arrow IPC stream format."""
+        from ossis.converters import from_ipc
+
+        rows, schema = from_ipc(data)
+        return cls(rows=rows, schema=schema)
+
+    def ipc(self, size=None) -> bytes:
+        """
+        Serialize an ossis DataFrame to bytes in the Arrow IPC stream format,
+        optionally limit the number of records.
+        """
+        from ossis.converters import to_ipc
+
+        return to_ipc(self, size=size)
+
     def pandas(self, size=None):
         from ossis.converters import to_pandas
 
@@ -187,6 +204,36 @@ class DataFrame:
         self._nbytes = None
         self._cursor = None
 
+    def extend(self, entries: Iterable):
+        """
+        Append a set of entries to the DataFrame.
+
+        Where there is no RelationSchema to validate against, the rows are added
+        in a single batch rather than one append at a time.
+
+        Parameters:
+            entries: iterable
+                The records to add, as accepted by append.
+        """
+        if isinstance(self._schema, RelationSchema):
+            for entry in entries:
+                self.append(entry)
+            return
+        self.materialize()
+        self._rows.extend(map(self._row_factory, entries))
+        # Invalidate nbytes cache instead of calculating on every append
+        self._nbytes = None
+        self._cursor = None
+
+    def clear(self):
+        """
+        Remove all of the rows from the DataFrame, keeping its schema so the
+        frame can be refilled without being rebuilt.
+        """
+        self._rows = []
+        self._nbytes = None
+        self._cursor = None
+
     def head(self, size: int = 5) -> "DataFrame":
         return self.slice(0, size)
 
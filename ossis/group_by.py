@@ -12,7 +12,9 @@
 
 import array
 import decimal
+from collections import Counter
 from collections import defaultdict
+from operator import itemgetter
 from typing import Any
 from typing import Callable
 from typing import Dict
@@ -198,16 +200,29 @@ class GroupBy:
             Dictionary
         """
         # COUNT is a little different, it doesn't have any fields to perform the
-        # aggregation on.
-        # This implementation could be improved by taking a copy of the
-        # aggregate() function and removing the bits that aren't needed to just
-        # count the values.
-        return self.aggregate(
-            (
-                "COUNT",
-                "*",
-            )
-        )
+        # aggregation on, so we don't need to collect any values - we only need to
+        # count the occurrences of each group, which Counter does in C.
+        source_columns = self._dictset.column_names
+        group_column_indicies = [source_columns.index(target) for target in self._columns]
+        group_column_names = [source_columns[column] for column in group_column_indicies]
+
+        if len(group_column_indicies) == 1:
+            counts = Counter(map(itemgetter(group_column_indicies[0]), self._dictset))
+            result_set = [
+                {"COUNT(*)": count, group_column_names[0]: group}
+                for group, count in counts.items()
+            ]
+        else:
+            counts = Counter(map(itemgetter(*group_column_indicies), self._dictset))
+            result_set = []
+            for group, count in counts.items():
+                results = {"COUNT(*)": count}
+                results.update(zip(group_column_names, group))
+                result_set.append(results)
+
+        from ossis.dataframe import DataFrame
+
+        return DataFrame(result_set)
 
     def avg(self, columns) -> "DataFrame":
         """
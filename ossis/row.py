@@ -76,7 +76,7 @@ def extract_columns(table: List[Dict[str, Any]], columns: List[str]) -> Tuple[Li
 
 def make_as_dict(fields):
     def _as_dict(self):
-        return {field: self[i] for i, field in enumerate(fields)}
+        return dict(zip(fields, self))
 
     return property(_as_dict)
 
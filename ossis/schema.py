@@ -52,6 +52,7 @@ Example:
 """
 
 from collections import defaultdict
+from copy import deepcopy
 from dataclasses import _MISSING_TYPE
 from dataclasses import asdict
 from dataclasses import dataclass
@@ -59,10 +60,13 @@ from dataclasses import field
 from dataclasses import fields
 from decimal import getcontext
 from enum import Enum
+from functools import lru_cache
+from sys import intern
 from typing import Any
 from typing import Callable
 from typing import Dict
 from typing import FrozenSet
+from typing import Iterable
 from typing import List
 from typing import MutableMapping
 from typing import Optional
@@ -78,6 +82,7 @@ from data_expectations import Expectation
 from ossis.exceptions import ColumnDefinitionError
 from ossis.exceptions import DataValidationError
 from ossis.exceptions import ExcessColumnsInDataError
+from ossis.tools import DecimalFactory
 from ossis.tools import arrow_type_map
 from ossis.tools import random_string
 from ossis.types import ossis_TO_PYTHON_MAP
@@ -124,7 +129,15 @@ class SchemaExpectation(Expectation):
         )
 
 
-@dataclass(init=False)
+@lru_cache(maxsize=None)
+def _column_fields(column_class: type) -> Tuple[Tuple[str, Any, Any], ...]:
+    """
+    The (name, default, default_factory) of each field of a column class, in order.
+    """
+    return tuple((f.name, f.default, f.default_factory) for f in fields(column_class))
+
+
+@dataclass(init=False, slots=True)
 class FlatColumn:
     """
     This is a standard column type.
@@ -152,8 +165,7 @@ class FlatColumn:
     fields: Optional[List["FlatColumn"]] = None
 
     def __init__(self, **kwargs):
-        attributes = {f.name: f for f in fields(self.__class__)}
-        for attribute in attributes:
+        for attribute, default, default_factory in _column_fields(self.__class__):
             if attribute in kwargs:
                 value = kwargs[attribute]
                 # Special handling for 'expectations'
@@ -174,13 +186,18 @@ class FlatColumn:
                     value = [v if isinstance(v, FlatColumn) else FlatColumn(**v) for v in value]
 
                 setattr(self, attribute, value)
-            elif not isinstance(attributes[attribute].default, _MISSING_TYPE):
-                setattr(self, attribute, attributes[attribute].default)
-            elif not isinstance(attributes[attribute].default_factory, _MISSING_TYPE):
-                setattr(self, attribute, attributes[attribute].default_factory())  # type:ignore
+            elif not isinstance(default, _MISSING_TYPE):
+                setattr(self, attribute, default)
+            elif not isinstance(default_factory, _MISSING_TYPE):
+                setattr(self, attribute, default_factory())  # type:ignore
             else:
                 raise ColumnDefinitionError(attribute)
 
+        # names are looked up in record dicts, interned names match keys written as
+        # literals by identity rather than by comparing the strings
+        if self.name.__class__ is str:
+            self.name = intern(self.name)
+
         # map literals to ossisTypes
         if self.type.__class__ is not ossisTypes:
             self.type, _length, _precision, _scale, _element_type = ossisTypes.from_name(self.type)
@@ -231,8 +248,6 @@ class FlatColumn:
         Returns:
             FlatColumn: A FlatColumn object containing the converted information.
         """
-        from ossis.tools import DecimalFactory
-
         # Fetch the native type mapping from Arrow to Python native types
         native_type = arrow_type_map(arrow_field.type)
         element_type = None
@@ -260,10 +275,6 @@ class FlatColumn:
             if field_type is None:
                 field_type = ossisTypes.VARCHAR
 
-        field_type._element_type = element_type
-        field_type._scale = scale
-        field_type._precision = precision
-
         return FlatColumn(
             name=str(arrow_field.name),
             type=field_type,
@@ -280,13 +291,17 @@ class FlatColumn:
         col.name = str(self.name)
         col.default = self.default
         col.description = self.description
+        col.disposition = self.disposition
         col.aliases = self.aliases
+        col.expectations = self.expectations
         col.identity = self.identity
         col.type = self.type
         col.element_type = self.element_type
         col.nullable = self.nullable
         col.scale = self.scale
         col.precision = self.precision
+        # on the virtual column types length is a row count rather than a type length
+        col.length = None
         col.lowest_value = self.lowest_value
         col.highest_value = self.highest_value
         col.null_count = self.null_count
@@ -330,7 +345,13 @@ class FlatColumn:
                 return o.__dict__
             raise TypeError(f"Object of type {o.__class__.__name__} is not JSON serializable")
 
-        return orjson.dumps(asdict(self), default=default_serializer)
+        # orjson serializes the nested columns, enums and lists itself, so only the top
+        # level needs to become a dict; asdict would deep copy the whole column first.
+        # Working state on the virtual columns (init=False fields) is not serialized.
+        return orjson.dumps(
+            {field.name: getattr(self, field.name) for field in fields(self) if field.init},
+            default=default_serializer,
+        )
 
     @classmethod
     def from_json(cls, json_str: str) -> "FlatColumn":
@@ -338,7 +359,7 @@ class FlatColumn:
         return cls(**data)
 
 
-@dataclass(init=False)
+@dataclass(init=False, slots=True)
 class FunctionColumn(FlatColumn):
     """
     This is a virtual column, it's nominally a column where the value is
@@ -358,10 +379,11 @@ class FunctionColumn(FlatColumn):
         Turn this virtual column into a list
         """
         value = self.binding(*self.configuration)
-        return numpy.array([value] * self.length)
+        # the binding is evaluated once and repeated in numpy, without an interim list
+        return numpy.repeat(numpy.array([value]), self.length, axis=0)
 
 
-@dataclass(init=False)
+@dataclass(init=False, slots=True)
 class ConstantColumn(FlatColumn):
     """
     Rather than pass around columns of constant values, where we can we should
@@ -375,9 +397,11 @@ class ConstantColumn(FlatColumn):
 
     length: int = 1
     value: Any = None
+    values: numpy.ndarray = field(init=False, repr=False, compare=False, default=None)
 
     def __init__(self, **kwargs):
-        super().__init__(**kwargs)
+        # slots=True dataclasses are rebuilt as a new class, which breaks zero-argument super()
+        FlatColumn.__init__(self, **kwargs)
         self.values = numpy.array([self.value])
 
     def materialize(self):
@@ -388,7 +412,7 @@ class ConstantColumn(FlatColumn):
         return numpy.full(self.length, self.values)
 
 
-@dataclass(init=False)
+@dataclass(init=False, slots=True)
 class SparseColumn(FlatColumn):
     """
     This is a column type optimized for sparse data.
@@ -397,12 +421,27 @@ class SparseColumn(FlatColumn):
 
     values: numpy.ndarray = None
     default_value: Any = None
+    indices: numpy.ndarray = field(init=False, repr=False, compare=False, default=None)
+    total_length: int = field(init=False, repr=False, compare=False, default=0)
 
     def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        (self.indices,) = numpy.where(numpy.array(self.values) != self.default_value)
-        self.values = numpy.array(self.values)[self.indices]
-        self.total_length = len(kwargs.get("values", []))  # Store the total length
+        FlatColumn.__init__(self, **kwargs)
+        values = numpy.asarray(self.values)
+        self.total_length = len(values)  # Store the total length
+        # positions are held in the smallest unsigned type able to address the column
+        self.indices = numpy.flatnonzero(values != self.default_value).astype(
+            numpy.min_scalar_type(max(self.total_length - 1, 0)), copy=False
+        )
+        self.values = values[self.indices]
+        if self.values.dtype == object and self.type.is_numeric():
+            # with the defaults (usually None) removed, numeric values can be held in a
+            # typed array, so arithmetic on them runs in one numpy loop - but only when
+            # they share a Python type, mixed ints and floats would be coerced
+            stored_values = self.values.tolist()
+            if len({type(value) for value in stored_values}) == 1:
+                typed_values = numpy.array(stored_values)
+                if typed_values.dtype.kind in "iuf":
+                    self.values = typed_values
 
     def materialize(self):
         """
@@ -415,7 +454,7 @@ class SparseColumn(FlatColumn):
         return materialized
 
 
-@dataclass(init=False)
+@dataclass(init=False, slots=True)
 class RLEColumn(FlatColumn):
     """
     This is a column type optimized for sequences of repeated values.
@@ -425,44 +464,27 @@ class RLEColumn(FlatColumn):
     lengths: List[int] = field(default_factory=list)
 
     def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        run_values = []
-        run_lengths = []
+        FlatColumn.__init__(self, **kwargs)
 
-        if len(self.values) == 0:
+        values = numpy.asarray(self.values)
+        if len(values) == 0:
             self.values = numpy.array([])
             return
 
-        prev_value = self.values[0]
-        run_length = 1
-
-        for value in self.values[1:]:
-            if value == prev_value:
-                run_length += 1
-            else:
-                run_values.append(prev_value)
-                run_lengths.append(run_length)
-
-                prev_value = value
-                run_length = 1
+        # a run starts at the first value and wherever a value differs from its predecessor
+        starts = numpy.flatnonzero(numpy.concatenate(([True], values[1:] != values[:-1])))
 
-        run_values.append(prev_value)
-        run_lengths.append(run_length)
-
-        self.values = numpy.array(run_values)
-        self.lengths = run_lengths
+        self.values = values[starts]
+        self.lengths = numpy.diff(numpy.append(starts, len(values))).tolist()
 
     def materialize(self):
         """
         Turn this compressed column back into its original form.
         """
-        materialized = []
-        for value, length in zip(self.values, self.lengths):
-            materialized.extend([value] * length)
-        return numpy.array(materialized)
+        return numpy.repeat(self.values, self.lengths)
 
 
-@dataclass(init=False)
+@dataclass(init=False, slots=True)
 class DictionaryColumn(FlatColumn):
     """
     If we know a column has a small amount of unique values AND is a large column
@@ -473,12 +495,18 @@ class DictionaryColumn(FlatColumn):
     """
 
     values: List[Any] = field(default_factory=list)
+    encoding: numpy.ndarray = field(init=False, repr=False, compare=False, default=None)
 
     def __init__(self, **kwargs):
-        super().__init__(**kwargs)
+        FlatColumn.__init__(self, **kwargs)
 
         values = numpy.asarray(self.values)
-        self.values, self.encoding = numpy.unique(values, return_inverse=True)
+        self.values, encoding = numpy.unique(values, return_inverse=True)
+        # the smallest unsigned type able to index the dictionary, usually one byte
+        # per value rather than eight
+        self.encoding = encoding.reshape(-1).astype(
+            numpy.min_scalar_type(max(len(self.values) - 1, 0)), copy=False
+        )
 
     def materialize(self):
         """
@@ -487,7 +515,7 @@ class DictionaryColumn(FlatColumn):
         return self.values[self.encoding]
 
 
-@dataclass
+@dataclass(slots=True)
 class RelationSchema:
     name: str
     aliases: List[str] = field(default_factory=list)
@@ -521,6 +549,22 @@ class RelationSchema:
     _column_by_name: Dict[str, FlatColumn] = field(
         init=False, repr=False, compare=False, default_factory=dict
     )
+    _column_lookup: Dict[str, Tuple[int, FlatColumn]] = field(
+        init=False, repr=False, compare=False, default_factory=dict
+    )
+    _column_lookup_casefolded: Dict[str, Tuple[int, FlatColumn]] = field(
+        init=False, repr=False, compare=False, default_factory=dict
+    )
+    _column_lookup_source: Optional[List[FlatColumn]] = field(
+        init=False, repr=False, compare=False, default=None
+    )
+    _validation_checks: Tuple[Tuple[str, bool, Optional[Tuple[type, ...]]], ...] = field(
+        init=False, repr=False, compare=False, default_factory=tuple
+    )
+    _arrow_schema: Any = field(init=False, repr=False, compare=False, default=None)
+    _arrow_schema_key: Optional[Tuple] = field(
+        init=False, repr=False, compare=False, default=None
+    )
 
     def __post_init__(self):
         self._rebuild_cache()
@@ -544,6 +588,48 @@ class RelationSchema:
                 if python_types is not None:
                     python_type_map[column.name] = python_types
         self._python_type_map = python_type_map
+        # for each column in order, whether it is nullable and the types it accepts
+        self._validation_checks = tuple(
+            (name, name in self._non_nullable_columns, python_type_map.get(name))
+            for name in dict.fromkeys(self._column_order)
+        )
+        self._rebuild_lookup()
+
+    def _check_record(self, data: MutableMapping) -> bool:
+        """
+        The per-record check used by `validate`, run against the column names,
+        nullability and types precomputed when the cache was built.
+
+        Returns:
+            True if the record is valid, or False if the record needs to be
+            checked in detail to report its errors.
+        """
+        extra_fields = data.keys() - self._column_name_set
+        if extra_fields:
+            raise ExcessColumnsInDataError(columns=extra_fields)
+        # with no extra fields, any shortfall is a missing column
+        if len(data) != len(self._column_name_set):
+            return False
+        for name, not_nullable, expected_types in self._validation_checks:
+            value = data[name]
+            if value is None:
+                if not_nullable:
+                    return False
+            elif expected_types is not None and not isinstance(value, expected_types):
+                return False
+        return True
+
+    def _rebuild_lookup(self) -> None:
+        # names and aliases to the position and column, the first column with a name wins
+        column_lookup: Dict[str, Tuple[int, FlatColumn]] = {}
+        column_lookup_casefolded: Dict[str, Tuple[int, FlatColumn]] = {}
+        for idx, column in enumerate(self.columns):
+            for name in column.all_names:
+                column_lookup.setdefault(name, (idx, column))
+                column_lookup_casefolded.setdefault(name.lower(), (idx, column))
+        self._column_lookup = column_lookup
+        self._column_lookup_casefolded = column_lookup_casefolded
+        self._column_lookup_source = self.columns
 
     def _ensure_cache(self) -> None:
         column_snapshot = tuple(
@@ -567,24 +653,19 @@ class RelationSchema:
         Returns:
             RelationSchema: A new RelationSchema containing the combined columns.
         """
-        new_schema = RelationSchema(name=self.name, aliases=self.aliases, columns=[])
-
         # Create a new list to hold the merged columns
         new_columns = self.columns[:]
 
         # Keep track of the seen identities - preload with the current set
-        seen_identities = [col.identity for col in self.columns]
+        seen_identities = {col.identity for col in self.columns}
 
         for column in other.columns:
             if column.identity not in seen_identities:
-                seen_identities.append(column.identity)
+                seen_identities.add(column.identity)
                 new_columns.append(column)
 
-        # Assign the new list of columns to the new schema
-        new_schema.columns = new_columns
-        new_schema._rebuild_cache()
-
-        return new_schema
+        # the caches are built once, from the merged columns
+        return RelationSchema(name=self.name, aliases=self.aliases, columns=new_columns)
 
     @property
     def num_columns(self) -> int:
@@ -603,13 +684,33 @@ class RelationSchema:
             Optional[FlatColumn]: The FlatColumn object, if found. None otherwise.
         """
         if case_insensitive:
-            for column in self.columns:
-                if column_name.lower() in [c.lower() for c in column.all_names]:
-                    return column
+            column_name = column_name.lower()
+            entry = self._column_lookup_casefolded.get(column_name)
         else:
-            for column in self.columns:
-                if column_name in column.all_names:
+            entry = self._column_lookup.get(column_name)
+
+        # the lookup is rebuilt when columns are added or removed through the schema, the
+        # columns can also be edited in place so a hit is checked before it is trusted
+        columns = self.columns
+        if entry is not None and columns is self._column_lookup_source:
+            idx, column = entry
+            if idx < len(columns) and columns[idx] is column:
+                names = column.all_names
+                if case_insensitive:
+                    names = [name.lower() for name in names]
+                if column_name in names:
                     return column
+
+        # a stale hit or a miss, scan the columns and rebuild the lookup if it was stale
+        for column in columns:
+            names = column.all_names
+            if case_insensitive:
+                names = [name.lower() for name in names]
+            if column_name in names:
+                self._rebuild_lookup()
+                return column
+        if entry is not None:
+            self._rebuild_lookup()
         return None
 
     def all_column_names(self) -> List[str]:
@@ -631,6 +732,43 @@ class RelationSchema:
         """Return the names for columns in this relation."""
         return [column.name for column in self.columns]
 
+    @property
+    def arrow_schema(self):
+        """
+        The pyarrow Schema for this relation.
+
+        The schema is only rebuilt when the columns, or the column attributes which
+        determine their arrow fields, have changed since it was last built.
+        """
+        key = tuple(
+            (
+                column.name,
+                column.type,
+                column.element_type,
+                column.precision,
+                column.scale,
+                column.nullable,
+            )
+            for column in self.columns
+        )
+        if key != self._arrow_schema_key:
+            import pyarrow
+
+            arrow_schema = pyarrow.schema([column.arrow_field for column in self.columns])
+            if any(column.fields for column in self.columns):
+                # nested struct fields can change without changing the key
+                return arrow_schema
+            self._arrow_schema = arrow_schema
+            self._arrow_schema_key = key
+        return self._arrow_schema
+
+    def __arrow_c_schema__(self):
+        """
+        Export the schema through the Arrow PyCapsule interface, so Arrow consumers
+        can read it directly, e.g. pyarrow.schema(relation_schema).
+        """
+        return self.arrow_schema.__arrow_c_schema__()
+
     def column(self, i: Union[int, str]) -> Optional[FlatColumn]:
         """
         Get column by name or index.
@@ -677,7 +815,19 @@ class RelationSchema:
             """Handle enum serialization."""
             return {key: value.value if isinstance(value, Enum) else value for key, value in obj}
 
-        return asdict(self, dict_factory=_converter)
+        # only the declared attributes, the lookup caches are rebuilt from the columns
+        return _converter(
+            (
+                attribute.name,
+                (
+                    [asdict(column, dict_factory=_converter) for column in self.columns]
+                    if attribute.name == "columns"
+                    else deepcopy(getattr(self, attribute.name))
+                ),
+            )
+            for attribute in fields(self)
+            if attribute.init
+        )
 
     @classmethod
     def from_dict(cls, dic: dict) -> "RelationSchema":
@@ -691,13 +841,13 @@ class RelationSchema:
         Returns:
             RelationSchema: A new RelationSchema object.
         """
-        schema = RelationSchema(name=dic["name"], aliases=dic.get("aliases", []))
-        for column in dic["columns"]:
-            if isinstance(column, dict):
-                schema.columns.append(FlatColumn(**column))
-            if isinstance(column, str):
-                schema.columns.append(FlatColumn(name=column))
-        return schema
+        columns = [
+            FlatColumn(name=column) if isinstance(column, str) else FlatColumn(**column)
+            for column in dic["columns"]
+            if isinstance(column, (str, dict))
+        ]
+        # build the schema with its columns so the caches are only built once
+        return RelationSchema(name=dic["name"], aliases=dic.get("aliases", []), columns=columns)
 
     def validate(self, data: MutableMapping) -> bool:
         """
@@ -714,15 +864,14 @@ class RelationSchema:
             TypeError: If data is not dictionary-like.
             DataValidationError: If data validation fails.
         """
-        if not isinstance(data, MutableMapping):
+        if data.__class__ is not dict and not isinstance(data, MutableMapping):
             raise TypeError("Cannot validate non Dictionary-type value")
 
         self._ensure_cache()
 
-        # Check if all fields in 'data' are in the schema
-        extra_fields = set(data.keys()) - self._column_name_set
-        if extra_fields:
-            raise ExcessColumnsInDataError(columns=extra_fields)
+        # Most records are valid, only work out the errors when the check fails
+        if self._check_record(data):
+            return True
 
         errors = defaultdict(list)
 
@@ -753,6 +902,34 @@ class RelationSchema:
             raise DataValidationError(errors=errors)
         return True
 
+    def validate_batch(self, rows: Iterable[MutableMapping]) -> bool:
+        """
+        Perform schema validation against a set of dictionary-formatted records,
+        checking the schema's cached column details once for the whole set rather
+        than once per record.
+
+        Parameters:
+            rows: Iterable[MutableMapping]
+                The dictionaries containing the data to validate against the schema.
+
+        Returns:
+            bool: True if all of the records are valid according to the schema.
+
+        Raises:
+            TypeError: If a record is not dictionary-like.
+            DataValidationError: For the first record which fails validation.
+        """
+        self._ensure_cache()
+        check_record = self._check_record
+
+        for data in rows:
+            if data.__class__ is not dict and not isinstance(data, MutableMapping):
+                raise TypeError("Cannot validate non Dictionary-type value")
+            if not check_record(data):
+                # validate works out and raises the errors for this record
+                self.validate(data)
+        return True
+
     def to_json(self):
         return {
             "name": self.name,
@@ -774,11 +951,11 @@ def convert_ossis_schema_to_arrow_schema(ossis_schema, use_identities: bool = Fa
     from pyarrow import schema
 
     if not use_identities:
-        return schema([col.arrow_field for col in ossis_schema.columns])
+        return ossis_schema.arrow_schema
 
     return schema(
         [
-            field(name=col.identity, type=col.arrow_field.type, nullable=col.arrow_field.nullable)
-            for col in ossis_schema.columns
+            field(name=col.identity, type=arrow_field.type, nullable=arrow_field.nullable)
+            for col, arrow_field in zip(ossis_schema.columns, ossis_schema.arrow_schema)
         ]
     )
@@ -20,6 +20,7 @@ import threading
 import time
 import uuid
 from collections import OrderedDict
+from functools import lru_cache
 from functools import wraps
 from random import getrandbits
 from typing import Any
@@ -509,48 +510,69 @@ def lru_cache_with_expiry(
     return wrapper
 
 
+_ONE = decimal.Decimal(1)
+
+
+@lru_cache(maxsize=256)
+def _ctx_and_factor(precision: int, scale: int) -> Tuple[decimal.Context, decimal.Decimal]:
+    """
+    Build (and cache) the decimal context and quantize factor for a precision/scale pair.
+    """
+    context = decimal.Context(prec=precision, rounding=decimal.ROUND_HALF_EVEN)
+    return context, _ONE.scaleb(-scale)
+
+
 def islice(iterator, size):
     for i in range(size):
         yield next(iterator)
 
 
-class DecimalFactory(decimal.Decimal):
+class DecimalFactory:
     """
-    DecimalFactory class extending Python's built-in decimal.Decimal.
-    It allows for custom precision and scale settings.
+    DecimalFactory creates decimal.Decimal values with custom precision and scale
+    settings.
     """
 
-    def __call__(self, value: Union[float, int, str]) -> decimal.Decimal:
+    __slots__ = ("precision", "scale")
+
+    def __init__(self, precision: Optional[int] = None, scale: Optional[int] = None):
+        self.precision = precision
+        self.scale = scale
+
+    def __call__(self, value: Union[decimal.Decimal, float, int, str]) -> decimal.Decimal:
         """
         Create a Decimal from value using the configured precision and scale.
 
         Parameters:
-            value: Union[float, int, str]
+            value: Union[decimal.Decimal, float, int, str]
                 The value to be converted to a decimal.
 
         Returns:
             decimal.Decimal: The quantized decimal.
         """
-        context = decimal.Context(
-            prec=self.precision,
-            rounding=decimal.ROUND_HALF_EVEN,
-        )
-
-        if isinstance(value, float):
-            value = format(value, ".99g")
-        elif isinstance(value, int):
-            value = str(value)
-        elif isinstance(value, bytes):
-            value = value.decode("utf-8")
-        value = value.strip()
-
-        if isinstance(value, str) and value.isdigit():
-            value += "." + "0"  # minimal fractional part to allow quantize
-
-        decimal_value = context.create_decimal(value)
-
         safe_scale = min(self.scale, 28)
-        factor = decimal.Decimal("10") ** -safe_scale
+        context, factor = _ctx_and_factor(self.precision, safe_scale)
+
+        if isinstance(value, decimal.Decimal):
+            # values which are already at the target scale and fit the precision
+            # (e.g. from a previous round trip) don't need to be quantized again
+            _, digits, exponent = value.as_tuple()
+            if exponent == -safe_scale and len(digits) <= context.prec:
+                return value
+            decimal_value = context.create_decimal(value)
+        else:
+            if isinstance(value, (str, bytes)):
+                if isinstance(value, bytes):
+                    value = value.decode("utf-8")
+                value = value.strip()
+                if value.isdigit():
+                    value += ".0"  # minimal fractional part to allow quantize
+            elif isinstance(value, float):
+                value = repr(value)
+            elif isinstance(value, int):
+                value = str(value)
+
+            decimal_value = context.create_decimal(value)
 
         # Perform quantization with proper error handling
         try:
@@ -574,7 +596,7 @@ class DecimalFactory(decimal.Decimal):
         cls, precision: Optional[int] = None, scale: Optional[int] = None
     ) -> "DecimalFactory":
         """
-        Create a new instance of DecimalFactory with attached precision and scale.
+        Get the DecimalFactory for the precision and scale, instances are shared.
 
         Parameters:
             precision: int
@@ -583,34 +605,38 @@ class DecimalFactory(decimal.Decimal):
         Returns:
             DecimalFactory instance with .__call__ behavior
         """
-        # Create an inert Decimal (value doesn't matter, won't be used)
-        instance = decimal.Decimal.__new__(cls, "0")
-        object.__setattr__(instance, "scale", scale)
-        object.__setattr__(instance, "precision", precision)
-        return instance
+        return _cached_decimal_factory(cls, precision, scale)
 
 
-def arrow_type_map(parquet_type) -> Union[Type, None]:
+@lru_cache(maxsize=256)
+def _cached_decimal_factory(
+    cls: Type[DecimalFactory], precision: Optional[int], scale: Optional[int]
+) -> DecimalFactory:
     """
-    Maps PyArrow types to corresponding Python types.
+    Factories are stateless once created, so share one instance per (precision, scale).
+    """
+    return cls(precision, scale)
 
-    Parameters:
-        parquet_type: lib.DataType
-            PyArrow DataType object.
 
-    Returns:
-        Type or None: Corresponding Python type for the PyArrow DataType or None if not recognized.
+_ARROW_TYPE_MAP: Optional[dict] = None
+_ARROW_DECIMAL_IDS: Optional[frozenset] = None
+_UNMAPPED = object()
 
-    Raises:
-        ValueError: If the PyArrow DataType is not recognized.
+
+def _build_arrow_type_map() -> None:
     """
+    Populate the PyArrow type id to Python type lookup, this is done once on first
+    use so importing this module doesn't require PyArrow.
+    """
+    global _ARROW_TYPE_MAP, _ARROW_DECIMAL_IDS
 
     try:
         import pyarrow.lib as lib
     except ImportError as import_error:
         raise MissingDependencyError(import_error.name) from import_error
 
-    type_map = {
+    _ARROW_DECIMAL_IDS = frozenset((lib.Type_DECIMAL128, lib.Type_DECIMAL256))
+    _ARROW_TYPE_MAP = {
         lib.Type_NA: None,
         lib.Type_BOOL: bool,
         lib.Type_INT8: int,
@@ -628,6 +654,7 @@ def arrow_type_map(parquet_type) -> Union[Type, None]:
         lib.Type_LARGE_STRING: str,
         lib.Type_DATE32: datetime.date,
         lib.Type_DATE64: datetime.datetime,
+        lib.Type_TIMESTAMP: datetime.datetime,
         lib.Type_TIME32: datetime.time,
         lib.Type_TIME64: datetime.time,
         lib.Type_INTERVAL_MONTH_DAY_NANO: datetime.timedelta,
@@ -642,12 +669,30 @@ def arrow_type_map(parquet_type) -> Union[Type, None]:
         lib.Type_STRING_VIEW: str,
     }
 
-    if parquet_type.id in type_map:
-        return type_map[parquet_type.id]
-    elif parquet_type.id in {lib.Type_DECIMAL128, lib.Type_DECIMAL256}:
+
+def arrow_type_map(parquet_type) -> Union[Type, None]:
+    """
+    Maps PyArrow types to corresponding Python types.
+
+    Parameters:
+        parquet_type: lib.DataType
+            PyArrow DataType object.
+
+    Returns:
+        Type or None: Corresponding Python type for the PyArrow DataType or None if not recognized.
+
+    Raises:
+        ValueError: If the PyArrow DataType is not recognized.
+    """
+    if _ARROW_TYPE_MAP is None:
+        _build_arrow_type_map()
+
+    type_id = parquet_type.id
+    python_type = _ARROW_TYPE_MAP.get(type_id, _UNMAPPED)
+    if python_type is not _UNMAPPED:
+        return python_type
+    if type_id in _ARROW_DECIMAL_IDS:
         return DecimalFactory.new_factory(parquet_type.precision, parquet_type.scale)
-    elif parquet_type.id == 18:  # not sure what 18 maps to
-        return datetime.datetime
 
     raise ValueError(f"Unable to map parquet type {parquet_type} ({parquet_type.id})")
 
@@ -674,14 +719,121 @@ def random_string(width: int = 16) -> str:
         str: Random hexadecimal string of the given length.
 
     Note:
-        This function generates a random hex string by first converting the
-        desired width into the number of random bits needed, and then
-        formatting it as a hexadecimal string.
+        This function draws the number of random bytes needed for the width and
+        lets `bytes.hex` produce the zero-padded hexadecimal string in C.
     """
-    num_chars = ((width + 1) >> 1) << 3  # Convert length to number of bits
-    rand_bytes = getrandbits(num_chars)  # Generate random bits
-    # Convert to hex string, clip '0x' prefix, and zero-fill as needed
-    return ("000000" + hex(rand_bytes)[2:])[-width:]
+    return random.randbytes((width + 1) >> 1).hex()[:width]
+
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+
+
+def _iso_from_epoch(value) -> datetime.datetime:
+    # naive UTC, built without creating (and then stripping) an aware datetime
+    return _EPOCH + datetime.timedelta(seconds=int(value))
+
+
+def _iso_from_datetime(value: datetime.datetime) -> datetime.datetime:
+    return value.replace(microsecond=0)
+
+
+def _iso_from_date(value: datetime.date) -> datetime.datetime:
+    return datetime.datetime.combine(value, datetime.time.min)
+
+
+def _iso_from_datetime64(value: numpy.datetime64) -> Optional[datetime.datetime]:
+    # at microsecond resolution this is always a datetime (None for NaT), except
+    # when outside the datetime range where numpy gives us an int
+    value = value.astype("datetime64[us]").item()
+    if type(value) is datetime.datetime:
+        return value.replace(microsecond=0)
+    return None
+
+
+def _iso_date(value: str) -> datetime.datetime:
+    # YYYY-MM-DD
+    return datetime.datetime(int(value[:4]), int(value[5:7]), int(value[8:10]))
+
+
+def _iso_minutes(value: str) -> Optional[datetime.datetime]:
+    # YYYY-MM-DD HH:MM
+    if value[10] not in ("T", " ") and value[13] != ":":
+        return None
+    return datetime.datetime(
+        int(value[:4]),
+        int(value[5:7]),
+        int(value[8:10]),
+        int(value[11:13]),
+        int(value[14:16]),
+    )
+
+
+def _iso_seconds(value: str) -> Optional[datetime.datetime]:
+    # YYYY-MM-DD HH:MM:SS, anything after the seconds is ignored
+    if value[16] != ":" or (value[10] not in ("T", " ") and value[13] != ":"):
+        return None
+    return datetime.datetime(
+        int(value[:4]),  # YYYY
+        int(value[5:7]),  # MM
+        int(value[8:10]),  # DD
+        int(value[11:13]),  # HH
+        int(value[14:16]),  # MM
+        int(value[17:19]),  # SS
+    )
+
+
+# The lenient parsers for each length of string we accept
+_ISO_LENGTH_HANDLERS: dict = {10: _iso_date, 16: _iso_minutes}
+_ISO_LENGTH_HANDLERS.update({length: _iso_seconds for length in range(19, 34)})
+
+
+def _iso_from_str(value: str) -> Optional[datetime.datetime]:
+    if value.isdigit():
+        return _iso_from_epoch(int(value))
+
+    if 10 <= len(value) <= 33:
+        if value[-1] == "Z":
+            value = value[:-1]
+        if "+" in value:
+            value = value.partition("+")[0]
+            if not 10 <= len(value) <= 28:
+                return None
+        val_len = len(value)
+        if value[4] != "-" or value[7] != "-":
+            return None
+        # the date, date+HH:MM and date+HH:MM:SS shapes can be handed to the C parser,
+        # fractional seconds are discarded so we only pass it the first 19 characters,
+        # anything it rejects falls through to the lenient parsing below
+        if val_len == 10 or (
+            (val_len == 16 or (val_len >= 19 and value[16] == ":")) and value[13] == ":"
+        ):
+            try:
+                return datetime.datetime.fromisoformat(value[:19])
+            except ValueError:
+                pass
+        handler = _ISO_LENGTH_HANDLERS.get(val_len)
+        if handler is not None:
+            return handler(value)
+    return None
+
+
+def _iso_from_bytes(value: bytes) -> Optional[datetime.datetime]:
+    return _iso_from_str(value.decode("utf-8"))
+
+
+# Dispatch on the exact type of the value, this is one dict lookup rather than
+# a ladder of comparisons for every value parsed
+_ISO_HANDLERS: dict = {
+    str: _iso_from_str,
+    bytes: _iso_from_bytes,
+    int: _iso_from_epoch,
+    float: _iso_from_epoch,
+    numpy.int64: _iso_from_epoch,
+    numpy.float64: _iso_from_epoch,
+    numpy.datetime64: _iso_from_datetime64,
+    datetime.datetime: _iso_from_datetime,
+    datetime.date: _iso_from_date,
+}
 
 
 def parse_iso(value):
@@ -702,84 +854,118 @@ def parse_iso(value):
     # If the last character is a Z, we ignore it.
     # If we can't parse as a date we return None rather than error
     try:
-        input_type = type(value)
-
+        handler = _ISO_HANDLERS.get(type(value))
+        if handler is not None:
+            return handler(value)
         if isinstance(value, bytes):
-            value = value.decode("utf-8")
-            input_type = str
+            return _iso_from_bytes(value)
+        if hasattr(value, "to_pydatetime"):
+            return value.to_pydatetime()
+        return None
+    except (ValueError, TypeError, OverflowError):
+        return None
 
-        if input_type == str and value.isdigit():
-            value = int(value)
-            input_type = int
 
-        if input_type == numpy.datetime64:
-            # this can create dates rather than datetimes, so don't return yet
-            value = value.astype(datetime.datetime)
-            input_type = type(value)
-            if input_type is int:
-                value /= 1000000000
+_ONE_MICROSECOND = datetime.timedelta(microseconds=1)
 
-        if input_type in (int, numpy.int64, float, numpy.float64):
-            return datetime.datetime.fromtimestamp(int(value), tz=datetime.timezone.utc).replace(
-                tzinfo=None
-            )
 
-        if hasattr(value, "to_pydatetime"):
-            return value.to_pydatetime()
+def parse_iso_into(
+    timestamps: numpy.ndarray, validity: numpy.ndarray, index: int, value
+) -> None:
+    """
+    Parse a value as `parse_iso` does, writing the result into preallocated buffers
+    rather than returning a datetime.
 
-        if input_type == datetime.datetime:
-            return value.replace(microsecond=0)
-        if input_type == datetime.date:
-            return datetime.datetime.combine(value, datetime.time.min)
-
-        # if we're here, we're doing string parsing
-        if input_type == str and 10 <= len(value) <= 33:
-            if value[-1] == "Z":
-                value = value[:-1]
-            if "+" in value:
-                value = value.split("+")[0]
-                if not 10 <= len(value) <= 28:
-                    return None
-            val_len = len(value)
-            if value[4] != "-" or value[7] != "-":
-                return None
-            if val_len == 10:
-                # YYYY-MM-DD
-                return datetime.datetime(
-                    *map(int, [value[:4], value[5:7], value[8:10]])  # type:ignore
-                )
-            if val_len >= 16:
-                if value[10] not in ("T", " ") and value[13] != ":":
-                    return None
-                if val_len >= 19 and value[16] == ":":
-                    # YYYY-MM-DD HH:MM:SS
-                    return datetime.datetime(
-                        *map(  # type:ignore
-                            int,
-                            [
-                                value[:4],  # YYYY
-                                value[5:7],  # MM
-                                value[8:10],  # DD
-                                value[11:13],  # HH
-                                value[14:16],  # MM
-                                value[17:19],  # SS
-                            ],
-                        )
-                    )
-                if val_len == 16:
-                    # YYYY-MM-DD HH:MM
-                    return datetime.datetime(
-                        *map(  # type:ignore
-                            int,
-                            [
-                                value[:4],
-                                value[5:7],
-                                value[8:10],
-                                value[11:13],
-                                value[14:16],
-                            ],
-                        )
-                    )
-        return None
-    except (ValueError, TypeError):
-        return None
+    The timestamp is written as microseconds since the epoch and a validity bit is
+    set when the value parses. Starting from a zeroed validity bitmap this is the
+    layout of an Arrow timestamp('us') array, so callers filling a column can build
+    the array from the buffers without a list of datetimes. Timezone-aware values
+    are converted to UTC.
+
+    Parameters:
+        timestamps: numpy.ndarray
+            int64 array the timestamp is written to at `index`.
+        validity: numpy.ndarray
+            uint8 bitmap, bit `index` is set if the value was parsed.
+        index: int
+            Position of the value in the column.
+        value: Any
+            The value to parse.
+    """
+    parsed = parse_iso(value)
+    if parsed is not None:
+        if parsed.tzinfo is not None:
+            parsed = parsed.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+        timestamps[index] = (parsed - _EPOCH) // _ONE_MICROSECOND
+        validity[index >> 3] |= 1 << (index & 7)
+
+
+def parse_iso_compiled(sample) -> Callable[[Any], Optional[datetime.datetime]]:
+    """
+    Create a date parser specialized for values of the same type as `sample`.
+
+    Columns almost always hold values of a single type, so the handler for that
+    type is resolved once here rather than for every value as `parse_iso` does.
+    Values of any other type are handed to `parse_iso`, so the results are the
+    same as calling it directly.
+
+    Parameters:
+        sample: Any
+            A representative value from the column to be parsed.
+
+    Returns:
+        Callable: A function parsing a single value to a datetime, or None.
+    """
+    sample_type = type(sample)
+    handler = _ISO_HANDLERS.get(sample_type)
+    if handler is None:
+        return parse_iso
+
+    def _parse(value) -> Optional[datetime.datetime]:
+        if type(value) is not sample_type:
+            return parse_iso(value)
+        try:
+            return handler(value)
+        except (ValueError, TypeError, OverflowError):
+            return None
+
+    return _parse
+
+
+def parse_iso_column(column):
+    """
+    Parse a PyArrow array of dates to timestamps, the columnar equivalent of
+    `parse_iso`.
+
+    Columns of cleanly formatted ISO strings are converted in one pass by Arrow,
+    anything else is parsed value by value with `parse_iso`, so the results
+    (including nulls for unparseable values) are the same either way.
+
+    Parameters:
+        column: pyarrow.Array or pyarrow.ChunkedArray
+            The values to parse.
+
+    Returns:
+        pyarrow.Array or pyarrow.ChunkedArray: A timestamp('us') array.
+    """
+    try:
+        import pyarrow
+        import pyarrow.compute as pc
+    except ImportError as import_error:
+        raise MissingDependencyError(import_error.name) from import_error
+
+    timestamp_type = pyarrow.timestamp("us")
+
+    if pyarrow.types.is_string(column.type) or pyarrow.types.is_large_string(column.type):
+        # parse_iso ignores fractional seconds and zones, so only the first 19
+        # characters matter - if every value is then one of the date, date+HH:MM or
+        # date+HH:MM:SS shapes Arrow can parse the whole column
+        trimmed = pc.utf8_slice_codeunits(column, 0, 19)
+        lengths = pc.fill_null(pc.cast(pc.utf8_length(trimmed), pyarrow.int64()), 10)
+        if pc.all(pc.is_in(lengths, value_set=pyarrow.array([10, 16, 19]))).as_py() is not False:
+            try:
+                return pc.cast(trimmed, timestamp_type)
+            except pyarrow.ArrowInvalid:
+                pass
+
+    return pyarrow.array([parse_iso(value) for value in column.to_pylist()], type=timestamp_type)
@@ -13,22 +13,59 @@
 import datetime
 import decimal
 import re
+from dataclasses import dataclass
+from decimal import getcontext
 from enum import Enum
+from functools import lru_cache
 from typing import Any
 from typing import Iterable
+from typing import Optional
 from typing import Tuple
 from typing import Type
 from typing import Union
 from warnings import warn
 
+import numpy
 import orjson
 
 from ossis.compute import parse_float16
+from ossis.compute import parse_float16_array
 from ossis.compute import parse_float32
+from ossis.compute import parse_float32_array
 from ossis.compute import parse_float64
+from ossis.exceptions import MissingDependencyError
+from ossis.tools import DecimalFactory
 from ossis.tools import parse_iso
 
+_pyarrow = None
 
+_ARRAY_RE = re.compile(r"ARRAY<([\w\s\[\]\(\)]+)>\Z")
+_DECIMAL_RE = re.compile(r"DECIMAL\((\d+),\s*(\d+)\)\Z")
+
+
+def _get_pyarrow():
+    global _pyarrow
+    if _pyarrow is None:
+        try:
+            import pyarrow
+
+            _pyarrow = pyarrow
+        except ImportError as import_error:
+            raise MissingDependencyError(import_error.name) from import_error
+    return _pyarrow
+
+
+def _bracketed_int(type_str: str, offset: int) -> Union[int, None]:
+    """
+    Read the integer in a trailing '[n]' parameter starting at offset, or None.
+    """
+    digits = type_str[offset:-1]
+    if type_str[-1] == "]" and digits.isdecimal():
+        return int(digits)
+    return None
+
+
+@lru_cache(maxsize=256)
 def _parse_type(type_str: str) -> Union[str, Tuple[str, Tuple[int, ...]]]:
     """
     Parses a SQL type string into its base type and optional parameters.
@@ -42,52 +79,57 @@ def _parse_type(type_str: str) -> Union[str, Tuple[str, Tuple[int, ...]]]:
             - A tuple with the base type and a tuple of integer parameters if applicable (e.g., ("DECIMAL", (10, 2))).
     """
 
-    # Match ARRAY<TYPE>
-    array_match = re.match(r"ARRAY<([\w\s\[\]\(\)]+)>", type_str)
-    if array_match:
-        return "ARRAY", (array_match.group(1),)
-
-    # Match DECIMAL(p,s)
-    decimal_match = re.match(r"DECIMAL\((\d+),\s*(\d+)\)", type_str)
-    if decimal_match:
-        precision, scale = map(int, decimal_match.groups())
-        return "DECIMAL", (precision, scale)
-
-    # Match VARCHAR[n]
-    varchar_match = re.match(r"VARCHAR\[(\d+)\]", type_str)
-    if varchar_match:
-        length = int(varchar_match.group(1))
-        return "VARCHAR", (length,)
-
-    # Match VARBINARY[n]
-    varbinary_match = re.match(r"VARBINARY\[(\d+)\]", type_str)
-    if varbinary_match:
-        size = int(varbinary_match.group(1))
-        return "VARBINARY", (size,)
-
-    # Match BLOB[n] (deprecated alias for VARBINARY)
-    blob_match = re.match(r"BLOB\[(\d+)\]", type_str)
-    if blob_match:
-        size = int(blob_match.group(1))
-        warn("Column type BLOB is deprecated; treating as VARBINARY. Use VARBINARY instead.")
-        return "VARBINARY", (size,)
+    if type_str.startswith("ARRAY<"):
+        array_match = _ARRAY_RE.match(type_str)
+        if array_match:
+            return "ARRAY", (array_match.group(1),)
+
+    elif type_str.startswith("DECIMAL("):
+        if type_str[-1] == ")":
+            precision, comma, scale = type_str[8:-1].partition(",")
+            scale = scale.lstrip()
+            if comma and precision.isdecimal() and scale.isdecimal():
+                return "DECIMAL", (int(precision), int(scale))
+        decimal_match = _DECIMAL_RE.match(type_str)
+        if decimal_match:
+            precision, scale = map(int, decimal_match.groups())
+            return "DECIMAL", (precision, scale)
+
+    elif type_str.startswith("VARCHAR["):
+        length = _bracketed_int(type_str, 8)
+        if length is not None:
+            return "VARCHAR", (length,)
+
+    elif type_str.startswith("VARBINARY["):
+        size = _bracketed_int(type_str, 10)
+        if size is not None:
+            return "VARBINARY", (size,)
+
+    elif type_str.startswith("BLOB["):
+        # deprecated alias for VARBINARY
+        size = _bracketed_int(type_str, 5)
+        if size is not None:
+            warn("Column type BLOB is deprecated; treating as VARBINARY. Use VARBINARY instead.")
+            return "VARBINARY", (size,)
 
     # If no parameters, return base type as a string
     return type_str.upper()
 
 
-def get_ossis_type(type_str: str) -> "ossisTypes":
+@lru_cache(maxsize=256)
+def get_ossis_type(type_str: str) -> "ResolvedType":
     """
-    Convert a type string to an ossisType enum value with full type information.
+    Convert a type string to an ossisType with full type information.
 
-    This function parses a type string and returns an ossisType enum value with
-    all relevant attributes set (precision, scale, length, element types).
+    This function parses a type string and returns a ResolvedType, which wraps
+    the ossisType enum value with all relevant attributes (precision, scale,
+    length, element types). The enum members themselves are not modified.
 
     Parameters:
         type_str (str): The type definition string (e.g., 'INTEGER', 'ARRAY<INTEGER>', 'DECIMAL(10,2)').
 
     Returns:
-        ossisTypes: The corresponding ossisType enum value with all attributes properly set.
+        ResolvedType: The corresponding ossisType enum value and its parameters.
 
     Raises:
         ValueError: If the type string is not recognized.
@@ -98,17 +140,17 @@ def get_ossis_type(type_str: str) -> "ossisTypes":
         True
 
         >>> t = get_ossis_type("DECIMAL(10,2)")
-        >>> t._precision
+        >>> t.precision
         10
-        >>> t._scale
+        >>> t.scale
         2
 
         >>> t = get_ossis_type("VARCHAR[255]")
-        >>> t._length
+        >>> t.length
         255
 
         >>> t = get_ossis_type("ARRAY<INTEGER>")
-        >>> t._element_type == ossisTypes.INTEGER
+        >>> t.element_type == ossisTypes.INTEGER
         True
     """
     if not type_str:
@@ -120,14 +162,7 @@ def get_ossis_type(type_str: str) -> "ossisTypes":
     if _type == 0 or _type is None:
         raise ValueError(f"Unknown type '{type_str}'")
 
-    # Attach all the metadata to the returned type instance
-    # The __init__ method initializes these as None, so we just update them
-    object.__setattr__(_type, "_length", _length)
-    object.__setattr__(_type, "_precision", _precision)
-    object.__setattr__(_type, "_scale", _scale)
-    object.__setattr__(_type, "_element_type", _element_type)
-
-    return _type
+    return ResolvedType(_type, _length, _precision, _scale, _element_type)
 
 
 class ossisTypes(str, Enum):
@@ -174,34 +209,18 @@ class ossisTypes(str, Enum):
 
     def is_numeric(self):
         """is the typle number-based"""
-        return self in (
-            self.INTEGER,
-            self.DOUBLE,
-            self.DECIMAL,
-            self.BOOLEAN,
-            self.INT8,
-            self.UINT8,
-            self.INT16,
-            self.UINT16,
-            self.INT32,
-            self.UINT32,
-            self.INT64,
-            self.UINT64,
-            self.FLOAT16,
-            self.FLOAT32,
-            self.FLOAT64,
-        )
+        return self in _NUMERIC_TYPES
 
     def is_temporal(self):
         """is the type time-based"""
-        return self in (self.DATE, self.TIME, self.TIMESTAMP)
+        return self in _TEMPORAL_TYPES
 
     def is_large_object(self):
         """is the type arbitrary length string"""
-        return self in (self.VARCHAR, self.BLOB, self.VARBINARY)
+        return self in _LARGE_OBJECT_TYPES
 
     def is_complex(self):
-        return self in (self.ARRAY, self.STRUCT, self.JSONB, self.INTERVAL)
+        return self in _COMPLEX_TYPES
 
     def __str__(self):
         if self.value == self.ARRAY and self._element_type is not None:
@@ -215,13 +234,18 @@ class ossisTypes(str, Enum):
         return self.value
 
     def parse(self, value: Any, **kwargs) -> Any:
+        if value is None:
+            return None
+
+        # most parsers ignore the type parameters so don't build them
+        parser = _UNPARAMETERIZED_PARSERS.get(self.value)
+        if parser is not None:
+            return parser(value)
+
         kwargs["length"] = kwargs.get("length", self._length)
         kwargs["precision"] = kwargs.get("precision", self._precision)
         kwargs["scale"] = kwargs.get("scale", self._scale)
         kwargs["element_type"] = kwargs.get("element_type", self._element_type)
-
-        if value is None:
-            return None
         return ossis_TO_PYTHON_PARSER[self.value](value, **kwargs)
 
     @property
@@ -230,36 +254,7 @@ class ossisTypes(str, Enum):
 
     @property
     def numpy_dtype(self):
-        import numpy
-
-        MAP = {
-            ossisTypes.ARRAY: numpy.dtype("O"),
-            ossisTypes.BLOB: numpy.dtype("S"),
-            ossisTypes.VARBINARY: numpy.dtype("S"),
-            ossisTypes.BOOLEAN: numpy.dtype("?"),
-            ossisTypes.DATE: numpy.dtype("datetime64[D]"),  # [2.5e16 BC, 2.5e16 AD]
-            ossisTypes.DECIMAL: numpy.dtype("O"),
-            ossisTypes.DOUBLE: numpy.dtype("float64"),
-            ossisTypes.FLOAT16: numpy.dtype("float16"),
-            ossisTypes.FLOAT32: numpy.dtype("float32"),
-            ossisTypes.FLOAT64: numpy.dtype("float64"),
-            ossisTypes.INTEGER: numpy.dtype("int64"),
-            ossisTypes.INT8: numpy.dtype("int8"),
-            ossisTypes.UINT8: numpy.dtype("uint8"),
-            ossisTypes.INT16: numpy.dtype("int16"),
-            ossisTypes.UINT16: numpy.dtype("uint16"),
-            ossisTypes.INT32: numpy.dtype("int32"),
-            ossisTypes.UINT32: numpy.dtype("uint32"),
-            ossisTypes.INT64: numpy.dtype("int64"),
-            ossisTypes.UINT64: numpy.dtype("uint64"),
-            ossisTypes.INTERVAL: numpy.dtype("m"),
-            ossisTypes.STRUCT: numpy.dtype("O"),
-            ossisTypes.TIMESTAMP: numpy.dtype("datetime64[us]"),  # [290301 BC, 294241 AD]
-            ossisTypes.TIME: numpy.dtype("O"),
-            ossisTypes.VARCHAR: numpy.dtype("U"),
-            ossisTypes.NULL: numpy.dtype("O"),
-        }
-        return MAP.get(self)
+        return _numpy_dtype_map().get(self)
 
     def to_arrow(
         self, *, element_type: "ossisTypes" = None, precision: int = None, scale: int = None
@@ -272,173 +267,415 @@ class ossisTypes(str, Enum):
             precision: Optional[int] - precision override for DECIMAL
             scale: Optional[int] - scale override for DECIMAL
         """
-        from decimal import getcontext as _getcontext
-
-        import pyarrow as pa
-
-        _precision = (
-            precision
-            if precision is not None
-            else (self._precision if self._precision is not None else _getcontext().prec)
-        )
-        _scale = scale if scale is not None else (self._scale if self._scale is not None else 10)
-
-        type_map = {
-            ossisTypes.BOOLEAN: pa.bool_(),
-            ossisTypes.BLOB: pa.binary(),
-            ossisTypes.VARBINARY: pa.binary(),
-            ossisTypes.DATE: pa.date64(),
-            ossisTypes.TIMESTAMP: pa.timestamp("us"),
-            ossisTypes.TIME: pa.time32("ms"),
-            ossisTypes.INTERVAL: pa.month_day_nano_interval(),
-            ossisTypes.DECIMAL: pa.decimal128(_precision, _scale),
-            ossisTypes.DOUBLE: pa.float64(),
-            ossisTypes.INTEGER: pa.int64(),
-            ossisTypes.INT8: pa.int8(),
-            ossisTypes.UINT8: pa.uint8(),
-            ossisTypes.INT16: pa.int16(),
-            ossisTypes.UINT16: pa.uint16(),
-            ossisTypes.INT32: pa.int32(),
-            ossisTypes.UINT32: pa.uint32(),
-            ossisTypes.INT64: pa.int64(),
-            ossisTypes.UINT64: pa.uint64(),
-            ossisTypes.FLOAT16: pa.float16(),
-            ossisTypes.FLOAT32: pa.float32(),
-            ossisTypes.FLOAT64: pa.float64(),
-            ossisTypes.VARCHAR: pa.string(),
-            ossisTypes.JSONB: pa.binary(),
-            ossisTypes.NULL: pa.null(),
-        }
+        # the parameterless types are shared singletons, the common case
+        arrow_type = _arrow_type_map().get(self)
+        if arrow_type is not None:
+            return arrow_type
+
+        if self == ossisTypes.DECIMAL:
+            _precision = (
+                precision
+                if precision is not None
+                else (self._precision if self._precision is not None else getcontext().prec)
+            )
+            _scale = (
+                scale if scale is not None else (self._scale if self._scale is not None else 10)
+            )
+            return _decimal_arrow_type(_precision, _scale)
 
         if self == ossisTypes.ARRAY:
             elem = element_type or self._element_type or ossisTypes.VARCHAR
-            if isinstance(elem, ossisTypes):
-                elem_pa_type = elem.to_arrow()
-            elif isinstance(elem, str) and elem in ossisTypes.__members__:
-                elem_pa_type = ossisTypes[elem].to_arrow()
-            else:
-                elem_pa_type = pa.string()
-            return pa.list_(elem_pa_type)
+            if isinstance(elem, ResolvedType):
+                elem = elem.base
+            elif not isinstance(elem, ossisTypes):
+                elem = ossisTypes.__members__.get(elem) if isinstance(elem, str) else None
+            return _list_arrow_type(elem)
 
         # For STRUCT we don't have child field information here; return binary as a sensible fallback.
         if self == ossisTypes.STRUCT:
-            return pa.binary()
+            return _arrow_type_map()[ossisTypes.BLOB]
 
-        return type_map.get(self, pa.string())
+        return (_pyarrow or _get_pyarrow()).string()
 
     @staticmethod
     def from_name(name: str) -> tuple:
-        _length = None
-        _precision = None
-        _scale = None
-        _element_type = None
-
-        if name is None:
-            return (ossisTypes._MISSING_TYPE, _length, _precision, _scale, _element_type)
-
-        type_name = str(name).upper()
-        parsed_types = _parse_type(type_name)
-        if isinstance(parsed_types, str):
-            if parsed_types == "ARRAY":
-                warn("Column type ARRAY without element_type, defaulting to VARCHAR.")
-                _type = ossisTypes.ARRAY
-                _element_type = ossisTypes.VARCHAR
-            elif parsed_types in ("NUMERIC", "BSON", "STRUCT", "LIST"):
-                raise ValueError(f"Column type {parsed_types} is deprecated.")
-            elif parsed_types in ossisTypes.__members__:
-                _type = ossisTypes[parsed_types]
-            elif parsed_types == "VARBINARY":
-                _type = ossisTypes.VARBINARY
-            elif parsed_types == "BLOB":
-                # This branch is mostly defensive; _parse_type handles BLOB[...] already.
-                warn("Column type BLOB is deprecated; use VARBINARY instead.")
-                _type = ossisTypes.VARBINARY
-            elif parsed_types == "DOUBLE":
-                warn("Column type DOUBLE is deprecated; use FLOAT64 instead.")
-                _type = ossisTypes.FLOAT64
-            elif parsed_types == "INTEGER":
-                warn("Column type INTEGER is deprecated; use INT64 instead.")
-                _type = ossisTypes.INT64
-            elif (
-                type_name == "0"
-                or type_name == 0
-                or type_name == "VARIANT"
-                or type_name == "MISSING"
-            ):
-                _type = 0
-            else:
-                raise ValueError(f"Unknown column type '{name}''.")
-        elif parsed_types[0] == "ARRAY":
+        # a ResolvedType compares equal to its bare member, so it would share that
+        # member's cache entry; it already carries its parameters so is unwrapped here
+        if name.__class__ is ResolvedType:
+            return (name.base, name.length, name.precision, name.scale, name.element_type)
+        return _from_name(name)
+
+
+@lru_cache(maxsize=256)
+def _from_name(name: str) -> tuple:
+    _length = None
+    _precision = None
+    _scale = None
+    _element_type = None
+
+    if name is None:
+        return (ossisTypes._MISSING_TYPE, _length, _precision, _scale, _element_type)
+
+    # canonical names, as written by our own serializer, need no parsing
+    _type = _PLAIN_TYPES.get(name)
+    if _type is not None:
+        return (_type, _length, _precision, _scale, _element_type)
+
+    type_name = str(name).upper()
+    parsed_types = _parse_type(type_name)
+    if isinstance(parsed_types, str):
+        if parsed_types == "ARRAY":
+            warn("Column type ARRAY without element_type, defaulting to VARCHAR.")
             _type = ossisTypes.ARRAY
-            _element_type = parsed_types[1][0]
-            if not _element_type.startswith(
-                (
-                    "INT",
-                    "UINT",
-                    "FLOAT",
-                    "VARCHAR",
-                    "VARBINARY",
-                    "BOOLEAN",
-                    "DATE",
-                    "TIMESTAMP",
-                    "TIME",
-                )
-            ):
-                raise ValueError(f"Invalid element type '{_element_type}' for ARRAY type.")
-            if _element_type in ossisTypes.__members__:
-                _type = ossisTypes.ARRAY
-                _element_type = ossisTypes[_element_type]
-            else:
-                raise ValueError(f"Unknown column type '{_element_type}'.")
-        elif parsed_types[0] == "DECIMAL":
-            _type = ossisTypes.DECIMAL
-            _precision, _scale = parsed_types[1]
-            if _precision < 0 or _precision > 38:
-                raise ValueError(f"Invalid precision '{_precision}' for DECIMAL type.")
-            if _scale < 0 or _scale > 38:
-                raise ValueError(f"Invalid scale '{_scale}' for DECIMAL type.")
-            if _precision < _scale:
-                raise ValueError(
-                    "Precision must be equal to or greater than scale for DECIMAL type."
-                )
-        elif parsed_types[0] == "VARCHAR":
-            _type = ossisTypes.VARCHAR
-            _length = parsed_types[1][0]
-        elif parsed_types[0] == "VARBINARY":
+            _element_type = ossisTypes.VARCHAR
+        elif parsed_types in ("NUMERIC", "BSON", "STRUCT", "LIST"):
+            raise ValueError(f"Column type {parsed_types} is deprecated.")
+        elif parsed_types in ossisTypes.__members__:
+            _type = ossisTypes[parsed_types]
+        elif parsed_types == "VARBINARY":
             _type = ossisTypes.VARBINARY
-            _length = parsed_types[1][0]
-        elif parsed_types[0] == "BLOB":
-            # Deprecated alias
+        elif parsed_types == "BLOB":
+            # This branch is mostly defensive; _parse_type handles BLOB[...] already.
             warn("Column type BLOB is deprecated; use VARBINARY instead.")
             _type = ossisTypes.VARBINARY
-            _length = parsed_types[1][0]
+        elif parsed_types == "DOUBLE":
+            warn("Column type DOUBLE is deprecated; use FLOAT64 instead.")
+            _type = ossisTypes.FLOAT64
+        elif parsed_types == "INTEGER":
+            warn("Column type INTEGER is deprecated; use INT64 instead.")
+            _type = ossisTypes.INT64
+        elif (
+            type_name == "0"
+            or type_name == 0
+            or type_name == "VARIANT"
+            or type_name == "MISSING"
+        ):
+            _type = 0
         else:
-            raise ValueError(f"Unknown column type '{_type}'.")
+            raise ValueError(f"Unknown column type '{name}''.")
+    elif parsed_types[0] == "ARRAY":
+        _type = ossisTypes.ARRAY
+        _element_type = parsed_types[1][0]
+        element = _ARRAY_ELEMENT_TYPES.get(_element_type)
+        if element is None:
+            if not _element_type.startswith(_ARRAY_ELEMENT_PREFIXES):
+                raise ValueError(f"Invalid element type '{_element_type}' for ARRAY type.")
+            raise ValueError(f"Unknown column type '{_element_type}'.")
+        _element_type = element
+    elif parsed_types[0] == "DECIMAL":
+        _type = ossisTypes.DECIMAL
+        _precision, _scale = parsed_types[1]
+        if _precision < 0 or _precision > 38:
+            raise ValueError(f"Invalid precision '{_precision}' for DECIMAL type.")
+        if _scale < 0 or _scale > 38:
+            raise ValueError(f"Invalid scale '{_scale}' for DECIMAL type.")
+        if _precision < _scale:
+            raise ValueError(
+                "Precision must be equal to or greater than scale for DECIMAL type."
+            )
+    elif parsed_types[0] == "VARCHAR":
+        _type = ossisTypes.VARCHAR
+        _length = parsed_types[1][0]
+    elif parsed_types[0] == "VARBINARY":
+        _type = ossisTypes.VARBINARY
+        _length = parsed_types[1][0]
+    elif parsed_types[0] == "BLOB":
+        # Deprecated alias
+        warn("Column type BLOB is deprecated; use VARBINARY instead.")
+        _type = ossisTypes.VARBINARY
+        _length = parsed_types[1][0]
+    else:
+        raise ValueError(f"Unknown column type '{_type}'.")
 
-        return (_type, _length, _precision, _scale, _element_type)
+    return (_type, _length, _precision, _scale, _element_type)
 
 
-BOOLEAN_STRINGS = (
-    "TRUE",
-    "ON",
-    "YES",
-    "1",
-    "1.0",
-    "T",
-    "Y",
-    b"TRUE",
-    b"ON",
-    b"YES",
-    b"1",
-    b"1.0",
-    b"T",
-    b"Y",
+# Type names which from_name resolves directly to the member of the same name,
+# ARRAY gets a default element type and STRUCT is rejected so they're excluded
+_PLAIN_TYPES = {
+    name: member
+    for name, member in ossisTypes.__members__.items()
+    if member not in (ossisTypes.ARRAY, ossisTypes.STRUCT)
+}
+
+# The types allowed as ARRAY elements
+_ARRAY_ELEMENT_PREFIXES = (
+    "INT",
+    "UINT",
+    "FLOAT",
+    "VARCHAR",
+    "VARBINARY",
+    "BOOLEAN",
+    "DATE",
+    "TIMESTAMP",
+    "TIME",
 )
+_ARRAY_ELEMENT_TYPES = {
+    name: member
+    for name, member in ossisTypes.__members__.items()
+    if name.startswith(_ARRAY_ELEMENT_PREFIXES)
+}
 
 
-def parse_decimal(value, *, precision=None, scale=None, **kwargs):
-    from ossis.tools import DecimalFactory
+@dataclass(frozen=True, slots=True)
+class ResolvedType:
+    """
+    An ossisTypes member together with the parameters read from a type string.
+
+    Compares equal to its base member, and the parameters are also available
+    under the underscored names used on ossisTypes members.
+    """
+
+    base: ossisTypes
+    length: Optional[int] = None
+    precision: Optional[int] = None
+    scale: Optional[int] = None
+    element_type: Optional[ossisTypes] = None
+
+    @property
+    def _length(self):
+        return self.length
+
+    @property
+    def _precision(self):
+        return self.precision
+
+    @property
+    def _scale(self):
+        return self.scale
+
+    @property
+    def _element_type(self):
+        return self.element_type
+
+    def __eq__(self, other):
+        # equality is on the base member alone, so it stays transitive and consistent
+        # with __hash__ (DECIMAL(10,2) == DECIMAL == DECIMAL(5,1)); compare the
+        # parameters explicitly where they matter
+        if isinstance(other, ResolvedType):
+            other = other.base
+        return self.base == other
+
+    def __hash__(self):
+        return hash(self.base)
+
+    def __str__(self):
+        base = self.base
+        if base == ossisTypes.ARRAY and self.element_type is not None:
+            return f"ARRAY<{self.element_type}>"
+        if base == ossisTypes.DECIMAL and self.precision is not None and self.scale is not None:
+            return f"DECIMAL({self.precision}, {self.scale})"
+        if base == ossisTypes.VARCHAR and self.length is not None:
+            return f"VARCHAR[{self.length}]"
+        if base in (ossisTypes.BLOB, ossisTypes.VARBINARY) and self.length is not None:
+            return f"VARBINARY[{self.length}]"
+        return base.value
+
+    def __getattr__(self, name):
+        # anything not parameterised (is_numeric, python_type, value...) comes from the base
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self.base, name)
+
+    def parse(self, value: Any, **kwargs) -> Any:
+        kwargs.setdefault("length", self.length)
+        kwargs.setdefault("precision", self.precision)
+        kwargs.setdefault("scale", self.scale)
+        kwargs.setdefault("element_type", self.element_type)
+        return self.base.parse(value, **kwargs)
+
+    def to_arrow(self, *, element_type=None, precision=None, scale=None):
+        return self.base.to_arrow(
+            element_type=element_type if element_type is not None else self.element_type,
+            precision=precision if precision is not None else self.precision,
+            scale=scale if scale is not None else self.scale,
+        )
+
 
+@lru_cache(maxsize=None)
+def _numpy_dtype_map() -> dict:
+    return {
+        ossisTypes.ARRAY: numpy.dtype("O"),
+        ossisTypes.BLOB: numpy.dtype("S"),
+        ossisTypes.VARBINARY: numpy.dtype("S"),
+        ossisTypes.BOOLEAN: numpy.dtype("?"),
+        ossisTypes.DATE: numpy.dtype("datetime64[D]"),  # [2.5e16 BC, 2.5e16 AD]
+        ossisTypes.DECIMAL: numpy.dtype("O"),
+        ossisTypes.DOUBLE: numpy.dtype("float64"),
+        ossisTypes.FLOAT16: numpy.dtype("float16"),
+        ossisTypes.FLOAT32: numpy.dtype("float32"),
+        ossisTypes.FLOAT64: numpy.dtype("float64"),
+        ossisTypes.INTEGER: numpy.dtype("int64"),
+        ossisTypes.INT8: numpy.dtype("int8"),
+        ossisTypes.UINT8: numpy.dtype("uint8"),
+        ossisTypes.INT16: numpy.dtype("int16"),
+        ossisTypes.UINT16: numpy.dtype("uint16"),
+        ossisTypes.INT32: numpy.dtype("int32"),
+        ossisTypes.UINT32: numpy.dtype("uint32"),
+        ossisTypes.INT64: numpy.dtype("int64"),
+        ossisTypes.UINT64: numpy.dtype("uint64"),
+        ossisTypes.INTERVAL: numpy.dtype("m"),
+        ossisTypes.STRUCT: numpy.dtype("O"),
+        ossisTypes.TIMESTAMP: numpy.dtype("datetime64[us]"),  # [290301 BC, 294241 AD]
+        ossisTypes.TIME: numpy.dtype("O"),
+        ossisTypes.VARCHAR: numpy.dtype("U"),
+        ossisTypes.NULL: numpy.dtype("O"),
+    }
+
+
+@lru_cache(maxsize=256)
+def _decimal_arrow_type(precision: int, scale: int):
+    return (_pyarrow or _get_pyarrow()).decimal128(precision, scale)
+
+
+@lru_cache(maxsize=256)
+def _list_arrow_type(element_type: Optional["ossisTypes"]):
+    pa = _pyarrow or _get_pyarrow()
+    if isinstance(element_type, ossisTypes):
+        return pa.list_(element_type.to_arrow())
+    return pa.list_(pa.string())
+
+
+@lru_cache(maxsize=None)
+def _arrow_type_map() -> dict:
+    """
+    The parameterless arrow types; DECIMAL, ARRAY and STRUCT are built by to_arrow.
+    """
+    pa = _get_pyarrow()
+
+    return {
+        ossisTypes.BOOLEAN: pa.bool_(),
+        ossisTypes.BLOB: pa.binary(),
+        ossisTypes.VARBINARY: pa.binary(),
+        ossisTypes.DATE: pa.date64(),
+        ossisTypes.TIMESTAMP: pa.timestamp("us"),
+        ossisTypes.TIME: pa.time32("ms"),
+        ossisTypes.INTERVAL: pa.month_day_nano_interval(),
+        ossisTypes.DOUBLE: pa.float64(),
+        ossisTypes.INTEGER: pa.int64(),
+        ossisTypes.INT8: pa.int8(),
+        ossisTypes.UINT8: pa.uint8(),
+        ossisTypes.INT16: pa.int16(),
+        ossisTypes.UINT16: pa.uint16(),
+        ossisTypes.INT32: pa.int32(),
+        ossisTypes.UINT32: pa.uint32(),
+        ossisTypes.INT64: pa.int64(),
+        ossisTypes.UINT64: pa.uint64(),
+        ossisTypes.FLOAT16: pa.float16(),
+        ossisTypes.FLOAT32: pa.float32(),
+        ossisTypes.FLOAT64: pa.float64(),
+        ossisTypes.VARCHAR: pa.string(),
+        ossisTypes.JSONB: pa.binary(),
+        ossisTypes.NULL: pa.null(),
+    }
+
+
+_NUMERIC_TYPES = frozenset(
+    (
+        ossisTypes.INTEGER,
+        ossisTypes.DOUBLE,
+        ossisTypes.DECIMAL,
+        ossisTypes.BOOLEAN,
+        ossisTypes.INT8,
+        ossisTypes.UINT8,
+        ossisTypes.INT16,
+        ossisTypes.UINT16,
+        ossisTypes.INT32,
+        ossisTypes.UINT32,
+        ossisTypes.INT64,
+        ossisTypes.UINT64,
+        ossisTypes.FLOAT16,
+        ossisTypes.FLOAT32,
+        ossisTypes.FLOAT64,
+    )
+)
+_TEMPORAL_TYPES = frozenset((ossisTypes.DATE, ossisTypes.TIME, ossisTypes.TIMESTAMP))
+_LARGE_OBJECT_TYPES = frozenset((ossisTypes.VARCHAR, ossisTypes.BLOB, ossisTypes.VARBINARY))
+_COMPLEX_TYPES = frozenset(
+    (ossisTypes.ARRAY, ossisTypes.STRUCT, ossisTypes.JSONB, ossisTypes.INTERVAL)
+)
+
+# Category flags used by find_compatible_type
+_NUMERIC = 1
+_TEMPORAL = 2
+_LARGE_OBJECT = 4
+_BINARY_COMPATIBLE = 8  # can all be held as VARBINARY
+_BINARY = 16
+_ALL_CATEGORIES = _NUMERIC | _TEMPORAL | _LARGE_OBJECT | _BINARY_COMPATIBLE | _BINARY
+
+_TYPE_CATEGORIES = {}
+for _t in ossisTypes:
+    _TYPE_CATEGORIES[_t] = (
+        (_NUMERIC if _t in _NUMERIC_TYPES else 0)
+        | (_TEMPORAL if _t in _TEMPORAL_TYPES else 0)
+        | (_LARGE_OBJECT if _t in _LARGE_OBJECT_TYPES else 0)
+    )
+for _t in (ossisTypes.BLOB, ossisTypes.VARBINARY):
+    _TYPE_CATEGORIES[_t] |= _BINARY_COMPATIBLE | _BINARY
+for _t in (ossisTypes.STRUCT, ossisTypes.JSONB, ossisTypes.VARCHAR):
+    _TYPE_CATEGORIES[_t] |= _BINARY_COMPATIBLE
+del _t
+
+# Type promotion hierarchy, within each category
+_TYPE_HIERARCHY = {
+    # Numeric promotion
+    ossisTypes.BOOLEAN: 1,
+    ossisTypes.INTEGER: 2,
+    ossisTypes.INT8: 2,
+    ossisTypes.UINT8: 2,
+    ossisTypes.INT16: 2,
+    ossisTypes.UINT16: 2,
+    ossisTypes.INT32: 2,
+    ossisTypes.UINT32: 2,
+    ossisTypes.INT64: 2,
+    ossisTypes.UINT64: 2,
+    ossisTypes.DOUBLE: 3,
+    ossisTypes.FLOAT16: 3,
+    ossisTypes.FLOAT32: 3,
+    ossisTypes.FLOAT64: 3,
+    ossisTypes.DECIMAL: 4,
+    # Temporal promotion
+    ossisTypes.DATE: 1,
+    ossisTypes.TIMESTAMP: 2,
+    # String/binary promotion
+    ossisTypes.BLOB: 1,
+    ossisTypes.VARBINARY: 1,
+    ossisTypes.VARCHAR: 2,
+}
+
+# Element types whose parsers are value-preserving for values already typed by
+# Arrow or numpy, so parse_array can convert the whole array in one call
+_ARRAY_PASSTHROUGH_TYPES = frozenset(
+    (
+        ossisTypes.BOOLEAN,
+        ossisTypes.DOUBLE,
+        ossisTypes.FLOAT32,
+        ossisTypes.FLOAT64,
+        ossisTypes.INTEGER,
+        ossisTypes.INT8,
+        ossisTypes.UINT8,
+        ossisTypes.INT16,
+        ossisTypes.UINT16,
+        ossisTypes.INT32,
+        ossisTypes.UINT32,
+        ossisTypes.INT64,
+        ossisTypes.UINT64,
+        ossisTypes.VARCHAR,
+    )
+)
+
+# Reduced precision floats are quantized over the whole array in one call
+_ARRAY_FLOAT_KERNELS = {
+    ossisTypes.FLOAT16: parse_float16_array,
+    ossisTypes.FLOAT32: parse_float32_array,
+}
+
+_BOOLEAN_STR = frozenset(("TRUE", "ON", "YES", "1", "1.0", "T", "Y"))
+_BOOLEAN_BYTES = frozenset((b"TRUE", b"ON", b"YES", b"1", b"1.0", b"T", b"Y"))
+BOOLEAN_STRINGS = _BOOLEAN_STR | _BOOLEAN_BYTES
+
+
+def parse_decimal(value, *, precision=None, scale=None, **kwargs):
     if value is None:
         return None
 
@@ -454,7 +691,7 @@ def parse_decimal(value, *, precision=None, scale=None, **kwargs):
         )
     )
     if isinstance(value, float):
-        value = format(value, ".99g")
+        value = repr(value)
     elif isinstance(value, int):
         value = str(value)
     elif isinstance(value, bytes):
@@ -506,15 +743,28 @@ PYTHON_TO_ossis_MAP[bytes] = ossisTypes.VARBINARY
 
 
 def parse_boolean(x, **kwargs):
-    return (x if isinstance(x, (bytes, str)) else str(x)).upper() in BOOLEAN_STRINGS
-
-
-def parse_bytes(x, **kwargs):
-    length = kwargs.get("length")
-    if isinstance(x, (dict, list, tuple, set)):
+    if type(x) is bool:
+        return x
+    if isinstance(x, str):
+        return x.upper() in _BOOLEAN_STR
+    if isinstance(x, bytes):
+        return x.upper() in _BOOLEAN_BYTES
+    return str(x).upper() in _BOOLEAN_STR
+
+
+def parse_bytes(x, length=None, **kwargs):
+    # check the exact common types first, before the container and fallback cases
+    value_type = type(x)
+    if value_type is bytes:
+        value = x
+    elif value_type is str:
+        value = x.encode("utf-8")
+    elif isinstance(x, (dict, list, tuple, set)):
         value = orjson.dumps(x)
+    elif isinstance(x, bytes):
+        value = x
     else:
-        value = str(x).encode("utf-8") if not isinstance(x, bytes) else x
+        value = str(x).encode("utf-8")
     if length:
         value = value[:length]
     return value
@@ -535,6 +785,8 @@ def parse_time(x, **kwargs):
 
 
 def parse_varchar(x, **kwargs):
+    if type(x) is str and not kwargs.get("length"):
+        return x
     byte_version = parse_bytes(x, **kwargs)
     if isinstance(byte_version, bytes):
         return byte_version.decode("utf-8")
@@ -544,67 +796,57 @@ def parse_varchar(x, **kwargs):
 def parse_array(x, **kwargs):
     element_type = kwargs.get("element_type")
     if not isinstance(x, (list, tuple, set)):
-        x = orjson.loads(x)
+        if hasattr(x, "as_py") and hasattr(x, "values"):
+            # pyarrow list scalar, if the values are already the element type
+            # Arrow has done the checking so we convert them in one call
+            values = x.values
+            if values is None:
+                return None
+            if element_type in _ARRAY_PASSTHROUGH_TYPES and values.type == element_type.to_arrow():
+                return values.to_pylist()
+            if element_type in _ARRAY_FLOAT_KERNELS and values.null_count == 0:
+                numbers = values.to_numpy(zero_copy_only=False)
+                if numbers.dtype.kind in "fiu":
+                    return _ARRAY_FLOAT_KERNELS[element_type](numbers)
+            x = values.to_pylist()
+        elif isinstance(x, numpy.ndarray) and x.ndim == 1:
+            # numpy array, as above the dtype has already bounded the values
+            if element_type in _ARRAY_PASSTHROUGH_TYPES and x.dtype == element_type.numpy_dtype:
+                return x.tolist()
+            if element_type in _ARRAY_FLOAT_KERNELS and x.dtype.kind in "fiu":
+                return _ARRAY_FLOAT_KERNELS[element_type](x)
+            x = x.tolist()
+        else:
+            x = orjson.loads(x)
     if element_type is None:
         return x
     parser = element_type.parse
     return [parser(v) for v in x]
 
 
-def parse_int8(x, **kwargs):
-    val = int(x)
-    if val < -128 or val > 127:
-        raise ValueError(f"INT8 value out of range: {val}")
-    return val
-
-
-def parse_uint8(x, **kwargs):
-    val = int(x)
-    if val < 0 or val > 255:
-        raise ValueError(f"UINT8 value out of range: {val}")
-    return val
-
-
-def parse_int16(x, **kwargs):
-    val = int(x)
-    if val < -32768 or val > 32767:
-        raise ValueError(f"INT16 value out of range: {val}")
-    return val
-
-
-def parse_uint16(x, **kwargs):
-    val = int(x)
-    if val < 0 or val > 65535:
-        raise ValueError(f"UINT16 value out of range: {val}")
-    return val
-
-
-def parse_int32(x, **kwargs):
-    val = int(x)
-    if val < -2147483648 or val > 2147483647:
-        raise ValueError(f"INT32 value out of range: {val}")
-    return val
-
-
-def parse_uint32(x, **kwargs):
-    val = int(x)
-    if val < 0 or val > 4294967295:
-        raise ValueError(f"UINT32 value out of range: {val}")
-    return val
+def _bounded_int_parser(name: str, low: int, high: int):
+    """
+    Create a parser for an integer type which rejects values outside [low, high].
+    """
 
+    def parse_bounded_int(x, **kwargs):
+        val = int(x)
+        if low <= val <= high:
+            return val
+        raise ValueError(f"{name} value out of range: {val}")
 
-def parse_int64(x, **kwargs):
-    val = int(x)
-    if val < -9223372036854775808 or val > 9223372036854775807:
-        raise ValueError(f"INT64 value out of range: {val}")
-    return val
+    parse_bounded_int.__name__ = f"parse_{name.lower()}"
+    return parse_bounded_int
 
 
-def parse_uint64(x, **kwargs):
-    val = int(x)
-    if val < 0 or val > 18446744073709551615:
-        raise ValueError(f"UINT64 value out of range: {val}")
-    return val
+parse_int8 = _bounded_int_parser("INT8", -128, 127)
+parse_uint8 = _bounded_int_parser("UINT8", 0, 255)
+parse_int16 = _bounded_int_parser("INT16", -32768, 32767)
+parse_uint16 = _bounded_int_parser("UINT16", 0, 65535)
+parse_int32 = _bounded_int_parser("INT32", -2147483648, 2147483647)
+parse_uint32 = _bounded_int_parser("UINT32", 0, 4294967295)
+parse_int64 = _bounded_int_parser("INT64", -9223372036854775808, 9223372036854775807)
+parse_uint64 = _bounded_int_parser("UINT64", 0, 18446744073709551615)
 
 
 def parse_null(x, **kwargs):
@@ -651,6 +893,32 @@ ossis_TO_PYTHON_PARSER: dict = {
     ossisTypes.NULL: parse_null,
 }
 
+# The parsers which don't use length, precision, scale or element_type
+_UNPARAMETERIZED_PARSERS: dict = {
+    _type: ossis_TO_PYTHON_PARSER[_type]
+    for _type in (
+        ossisTypes.BOOLEAN,
+        ossisTypes.DATE,
+        ossisTypes.TIMESTAMP,
+        ossisTypes.TIME,
+        ossisTypes.INTERVAL,
+        ossisTypes.DOUBLE,
+        ossisTypes.FLOAT16,
+        ossisTypes.FLOAT32,
+        ossisTypes.FLOAT64,
+        ossisTypes.INTEGER,
+        ossisTypes.INT8,
+        ossisTypes.UINT8,
+        ossisTypes.INT16,
+        ossisTypes.UINT16,
+        ossisTypes.INT32,
+        ossisTypes.UINT32,
+        ossisTypes.INT64,
+        ossisTypes.UINT64,
+        ossisTypes.NULL,
+    )
+}
+
 
 def find_compatible_type(types: Iterable[ossisTypes], default=ossisTypes.VARCHAR) -> ossisTypes:
     """
@@ -668,61 +936,39 @@ def find_compatible_type(types: Iterable[ossisTypes], default=ossisTypes.VARCHAR
         >>> ossisTypes.find_compatible_type([ossisTypes.BLOB, ossisTypes.VARCHAR])
         ossisTypes.VARCHAR
     """
+    types = tuple(types)
     if not types:
         return ossisTypes.NULL
 
+    # One pass: intersect the category flags, union the binary flag, and keep the
+    # first highest-ranked type and whether every type matches the first.
+    first = types[0]
+    uniform = True
+    common = _ALL_CATEGORIES
+    seen = 0
+    best = first
+    best_rank = _TYPE_HIERARCHY.get(first, 0)
+    for t in types:
+        flags = _TYPE_CATEGORIES.get(t, 0)
+        common &= flags
+        seen |= flags
+        if t != first:
+            uniform = False
+            rank = _TYPE_HIERARCHY.get(t, 0)
+            if rank > best_rank:
+                best, best_rank = t, rank
+
     # Handle single type case
-    if len(set(types)) == 1:
-        return types[0]
-
-    # Define type promotion hierarchy
-    type_hierarchy = {
-        # Numeric promotion
-        ossisTypes.BOOLEAN: 1,
-        ossisTypes.INTEGER: 2,
-        ossisTypes.INT8: 2,
-        ossisTypes.UINT8: 2,
-        ossisTypes.INT16: 2,
-        ossisTypes.UINT16: 2,
-        ossisTypes.INT32: 2,
-        ossisTypes.UINT32: 2,
-        ossisTypes.INT64: 2,
-        ossisTypes.UINT64: 2,
-        ossisTypes.DOUBLE: 3,
-        ossisTypes.FLOAT16: 3,
-        ossisTypes.FLOAT32: 3,
-        ossisTypes.FLOAT64: 3,
-        ossisTypes.DECIMAL: 4,
-        # Temporal promotion
-        ossisTypes.DATE: 1,
-        ossisTypes.TIMESTAMP: 2,
-        # String/binary promotion
-        ossisTypes.BLOB: 1,
-        ossisTypes.VARBINARY: 1,
-        ossisTypes.VARCHAR: 2,
-    }
+    if uniform:
+        return first
 
     # First check if all types are in the same category
-    if all(t.is_numeric() for t in types):
-        return max(types, key=lambda t: type_hierarchy.get(t, 0))
-    if all(t.is_temporal() for t in types):
-        return max(types, key=lambda t: type_hierarchy.get(t, 0))
-    if all(t.is_large_object() for t in types):
-        return max(types, key=lambda t: type_hierarchy.get(t, 0))
-    if all(
-        t
-        in (
-            ossisTypes.BLOB,
-            ossisTypes.VARBINARY,
-            ossisTypes.STRUCT,
-            ossisTypes.JSONB,
-            ossisTypes.VARCHAR,
-        )
-        for t in types
-    ):
+    if common & (_NUMERIC | _TEMPORAL | _LARGE_OBJECT):
+        return best
+    if common & _BINARY_COMPATIBLE:
         return ossisTypes.VARBINARY
 
     # For heterogeneous types, default to the most flexible type
-    if any(t in (ossisTypes.BLOB, ossisTypes.VARBINARY) for t in types):
+    if seen & _BINARY:
         return ossisTypes.VARBINARY
     return default
@@ -13,7 +13,6 @@ import opteryx
 
 from ossis import DataFrame
 from ossis import Row
-from ossis.compute.compiled import process_table
 from ossis.converters import from_arrow
 from ossis.exceptions import MissingDependencyError
 from ossis.row import Row
@@ -61,17 +60,27 @@ def _from_arrow(tables, size=None):
         columns=[FlatColumn.from_arrow(field) for field in arrow_schema],
     )
     row_factory = Row.create_class(ossis_schema, tuples_only=True)
-    rows: typing.List[Row] = []
 
-    for table in itertools.chain([first_table], tables):
-        rows.extend(process_table(table, row_factory, 10_000))
-        if len(rows) > size:
-            break
-
-    # Limit the number of rows to 'size'
-    if isinstance(size, int):
-        rows = itertools.islice(rows, size)
-    return rows, ossis_schema
+    def _rows():
+        # yield rows as each batch is converted, stopping once we have 'size'
+        # rows so no later batches or tables are touched
+        remaining = size
+        for table in itertools.chain([first_table], tables):
+            for batch in table.to_batches(BATCH_SIZE):
+                if remaining < batch.num_rows:
+                    batch = batch.slice(0, remaining)
+                # Arrow is already columnar, convert each column in one call and
+                # zip them into rows rather than walking the batch row by row
+                columns = batch.to_pydict()
+                if columns:
+                    yield from map(row_factory, zip(*columns.values()))
+                else:
+                    yield from (row_factory(()) for _ in range(batch.num_rows))
+                remaining -= batch.num_rows
+                if remaining <= 0:
+                    return
+
+    return _rows(), ossis_schema
 
 
 
@@ -94,10 +103,14 @@ print("numpy time:", (time.monotonic_ns() - t) / 1e9, "records:", 0)
 
 
 def process_set(set_with_nan):
-    has_nan = any(item != item for item in set_with_nan)  # Check for NaN using NaN's property
-    set_without_nan = {
-        item for item in set_with_nan if item == item
-    }  # Create a new set without NaNs
+    # split out NaNs (the only values not equal to themselves) in one pass
+    has_nan = False
+    set_without_nan = set()
+    for item in set_with_nan:
+        if item != item:
+            has_nan = True
+        else:
+            set_without_nan.add(item)
     return has_nan, set_without_nan
 
 
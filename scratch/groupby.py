@@ -1,4 +1,3 @@
-import collections
 import cProfile
 import os
 import pstats
@@ -15,21 +14,35 @@ import ossis
 sys.path.insert(1, os.path.join(sys.path[0], ".."))
 
 
-def group_by(lst, key_func):
-    groups = collections.defaultdict(list)
-    for item in lst:
-        groups[key_func(item)].append(item)
-    return dict(groups)
+def group_by(keys, values):
+    # sort once, then cut the sorted values at each change of key
+    order = numpy.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    unique_keys, starts = numpy.unique(sorted_keys, return_index=True)
+    groups = numpy.split(values[order], starts[1:])
+    return dict(zip(unique_keys.tolist(), groups))
+
+
+def count_by(keys):
+    order = numpy.argsort(keys, kind="stable")
+    unique_keys, starts = numpy.unique(keys[order], return_index=True)
+    counts = numpy.diff(numpy.r_[starts, len(keys)])
+    return dict(zip(unique_keys.tolist(), counts.tolist()))
 
 
 # Generate a large dataset with 5 million items and approximately 5000 groups
-data = [(random.randint(0, 4999), random.random()) for _ in range(5000000)]
+keys = numpy.random.randint(0, 5000, size=5000000, dtype=numpy.int32)
+values = numpy.random.random(5000000)
 t = time.monotonic_ns()
-# Group the data by the first element of each tuple
-groups = group_by(data, lambda x: x[0])
+# Group the data by the key
+groups = group_by(keys, values)
 
 print(len(groups), (time.monotonic_ns() - t) / 1e9)  # Output: 5000
 
+t = time.monotonic_ns()
+counts = count_by(keys)
+print(len(counts), (time.monotonic_ns() - t) / 1e9)  # Output: 5000
+
 data = ossis.DataFrame([{"value": random.randint(0, 4999), "val": random.random} for _ in range(5000000)])
 t = time.monotonic_ns()
 groups = list(data.group_by("value").count())
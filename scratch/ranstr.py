@@ -3,6 +3,7 @@ import secrets
 import sys
 import timeit
 from random import getrandbits
+from random import randbytes
 
 sys.path.insert(1, os.path.join(sys.path[0], ".."))
 
@@ -32,16 +33,27 @@ def random_string_secrets(width: int = 16):
     rand_hex = secrets.token_hex(num_bytes)  # Generate a hex string
     return rand_hex[:width]  # Truncate to desired length
 
+def random_string_urandom(width: int = 16):
+    return os.urandom((width + 1) >> 1).hex()[:width]
+
+def random_string_randbytes(width: int = 16):
+    # what ossis.tools.random_string uses, identities don't need to be cryptographic
+    return randbytes((width + 1) >> 1).hex()[:width]
+
 # Test each function with a timer
 old_time = timeit.timeit(lambda: random_string_old(width), number=1000000)
 format_time = timeit.timeit(lambda: random_string_format(width), number=1000000)
 fstring_time = timeit.timeit(lambda: random_string_fstring(width), number=1000000)
 secrets_time = timeit.timeit(lambda: random_string_secrets(width), number=1000000)
-nothing_time = timeit.timeit(hex(0), number=1000000)
+urandom_time = timeit.timeit(lambda: random_string_urandom(width), number=1000000)
+randbytes_time = timeit.timeit(lambda: random_string_randbytes(width), number=1000000)
+nothing_time = timeit.timeit(lambda: hex(0), number=1000000)
 
 print(f"Old method took: {old_time} seconds")
 print(f"Format method took: {format_time} seconds")
 print(f"F-string method took: {fstring_time} seconds")
 print(f"Secret method took: {secrets_time} seconds")
+print(f"urandom method took: {urandom_time} seconds")
+print(f"randbytes method took: {randbytes_time} seconds")
 print(f"Nothing method took: {nothing_time} seconds")
 
@@ -14,10 +14,10 @@ def approach_one():
     import opteryx
 
     df = opteryx.query("SELECT * FROM $satellites")
+    o = DataFrame(schema=df.column_names)
     for i in range(100000):
-        o = DataFrame(schema=df.column_names)
-        for row in df:
-            o.append(row)
+        o.clear()
+        o.extend(df)
     print(o.shape)
 
 @monitor()
@@ -26,8 +26,7 @@ def approach_two():
 
     df = opteryx.query("SELECT * FROM $satellites")
     for i in range(100000):
-        rows = (row for row in df)
-        o = DataFrame(schema=df.column_names, rows=rows)
+        o = DataFrame(schema=df.column_names, rows=df)
     print(o.shape)
 
 @monitor()
@@ -36,7 +35,6 @@ def approach_three():
 
     df = opteryx.query("SELECT * FROM $satellites").arrow()
     for i in range(100000):
-        rows = (row for row in df)
         o = DataFrame.from_arrow(df)
     print(o.shape)
 
@@ -5,6 +5,7 @@ import time
 import opteryx
 
 from ossis import Row
+from ossis.dataframe import DataFrame
 from ossis.row import extract_columns
 
 sys.path.insert(1, os.path.join(sys.path[0], ".."))
@@ -37,3 +38,13 @@ for record in data:
 
 print((time.monotonic_ns() - t) / 1e9, bytestring)
 
+# the whole relation as one Arrow IPC stream rather than row by row
+frame = DataFrame.from_arrow(data.arrow())
+
+t = time.monotonic_ns()
+for i in range(1000):
+    bytestring = frame.ipc()
+    restored = DataFrame.from_ipc(bytestring)
+    restored.materialize()
+
+print((time.monotonic_ns() - t) / 1e9, len(bytestring))
@@ -5,7 +5,7 @@ import time
 import numpy
 import opteryx
 
-from ossis.compute.compiled import extract_dict_columns
+from ossis.compute.compiled import extract_dict_columns_batch
 
 sys.path.insert(1, os.path.join(sys.path[0], ".."))
 
@@ -20,10 +20,9 @@ def test_collector():
     df = opteryx.query("SELECT * FROM $missions").arrow().to_pylist()
     start = time.monotonic_ns()
     for i in range(1000):
-        for r in df:
-            d = extract_dict_columns(r, ("Company", "Location", "Price", "Rocket", "Rocket_Status", "Mission"))
+        d = extract_dict_columns_batch(df, ("Company", "Location", "Price", "Rocket", "Rocket_Status", "Mission"))
     print((time.monotonic_ns() - start) / 1e9)
-    print(d)
+    print(d[-1])
 
 
 if __name__ == "__main__":  # prgama: nocover
@@ -3,10 +3,16 @@ import string
 from typing import List
 
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 
 from cityhash import CityHash32
 
 punctuation_pattern = re.compile(r'[{}]'.format(re.escape(string.punctuation)))
+punctuation_table = str.maketrans(dict.fromkeys(string.punctuation, ' '))
+
+# 2^64 / phi, the multiplier for Fibonacci hashing
+PHI64 = np.uint64(11400714819323198485)
 
 
 def hash_token(token: str, vector_size: int) -> int:
@@ -24,6 +30,24 @@ def hash_token(token: str, vector_size: int) -> int:
     """
     return CityHash32(token) % vector_size
 
+def fibonacci_index(hashes: np.ndarray, vector_size: int) -> np.ndarray:
+    """
+    Map hashes to vector indices with Fibonacci (multiplicative) hashing, an
+    integer multiply and shift rather than a float multiply.
+
+    Parameters:
+        hashes: np.ndarray
+            The hash values to map.
+        vector_size: int
+            The size of the vector, expected to be a power of two.
+
+    Returns:
+        A numpy array of indices into the vector.
+    """
+    shift = np.uint64(64 - (vector_size.bit_length() - 1))
+    # uint64 multiplication wraps, which is the modulo 2^64 the method relies on
+    return ((hashes.astype(np.uint64) * PHI64) >> shift).astype(np.int64) % vector_size
+
 def vectorize_with_hashing(tokens: List[str], vector_size: int = 1024) -> np.ndarray:
     """
     Vectorize a list of tokens using the hashing trick into a fixed-size vector.
@@ -37,18 +61,42 @@ def vectorize_with_hashing(tokens: List[str], vector_size: int = 1024) -> np.nda
     Returns:
         A numpy array of type uint16 representing the hashed BoW vector.
     """
-    # Initialize a vector of zeros with uint16 type to simulate 2-byte storage
-    vector = np.zeros(vector_size, dtype=np.uint16)
-    for token in tokens:
-        index = hash_token(token, vector_size)
-        # Increment the count at the hashed index position
-        # In a strict 2-byte environment, care must be taken to avoid overflow
-        vector[index] += 1
-
-        index_2 = int(index * 1.618033988749895) % vector_size
-        vector[index_2] += 1
+    # Hash every token in one pass, then histogram the primary and Fibonacci
+    # secondary indices together rather than incrementing one slot at a time
+    hashes = np.fromiter((CityHash32(token) for token in tokens), dtype=np.uint32, count=len(tokens))
+    primary = hashes.astype(np.int64) % vector_size
+    secondary = fibonacci_index(hashes, vector_size)
+    counts = np.bincount(np.concatenate((primary, secondary)), minlength=vector_size)
+    # In a strict 2-byte environment, care must be taken to avoid overflow
+    vector = counts.astype(np.uint16)
     return vector
 
+def vectorize_corpus_with_hashing(tokenized_strings: List[List[str]], vector_size: int = 1024) -> np.ndarray:
+    """
+    Vectorize a corpus of token lists in one pass, the batch form of
+    `vectorize_with_hashing`.
+
+    Parameters:
+        tokenized_strings: List[List[str]]
+            The token lists to vectorize, one per string.
+        vector_size: int, optional
+            The size of the vectors. Defaults to 1024.
+
+    Returns:
+        A numpy array of type uint16 with one hashed BoW vector per row.
+    """
+    lengths = np.fromiter(map(len, tokenized_strings), dtype=np.int64, count=len(tokenized_strings))
+    tokens = [token for tokens in tokenized_strings for token in tokens]
+    hashes = np.fromiter(map(CityHash32, tokens), dtype=np.uint32, count=len(tokens))
+    # offset each index by its string's row so one histogram fills the whole matrix
+    offsets = np.repeat(np.arange(len(tokenized_strings), dtype=np.int64) * vector_size, lengths)
+    primary = hashes.astype(np.int64) % vector_size + offsets
+    secondary = fibonacci_index(hashes, vector_size) + offsets
+    counts = np.bincount(
+        np.concatenate((primary, secondary)), minlength=len(tokenized_strings) * vector_size
+    )
+    return counts.astype(np.uint16).reshape(len(tokenized_strings), vector_size)
+
 def cosine_similarity(vec1: np.ndarray, vec2: np.ndarray) -> float:
     """
     Calculate the cosine similarity between two vectors.
@@ -68,11 +116,26 @@ def cosine_similarity(vec1: np.ndarray, vec2: np.ndarray) -> float:
     return np.dot(vec1, vec2) / (np.linalg.norm(vec1) * np.linalg.norm(vec2))
 
 def tokenize(arr):
-    # Replace each punctuation mark with a space
-    no_punctuation = punctuation_pattern.sub(' ', arr)
-    # Split the modified string into tokens by spaces and filter out empty tokens
-    tokens = [token for token in no_punctuation.lower().split(' ') if token]
-    return tokens
+    # Replace each punctuation mark with a space, a table lookup rather than a regex
+    no_punctuation = arr.translate(punctuation_table)
+    # Split the modified string into tokens on whitespace, which drops empty tokens
+    return no_punctuation.lower().split()
+
+def tokenize_all(strings: List[str]) -> List[List[str]]:
+    """
+    Tokenize a list of strings in one pass using Arrow string kernels.
+
+    Parameters:
+        strings: List[str]
+            The strings to tokenize.
+
+    Returns:
+        A list of token lists, matching `tokenize` applied to each string.
+    """
+    array = pa.array(strings, type=pa.string())
+    no_punctuation = pc.replace_substring_regex(array, pattern=punctuation_pattern.pattern, replacement=" ")
+    token_lists = pc.utf8_split_whitespace(pc.utf8_lower(no_punctuation))
+    return [[token for token in tokens if token] for tokens in token_lists.to_pylist()]
 
 def similarity_engine_with_hashing(strings: List[str], comparison_string: str, vector_size: int = 1024) -> List[float]:
     """
@@ -89,10 +152,13 @@ def similarity_engine_with_hashing(strings: List[str], comparison_string: str, v
     Returns:
         A list of similarity scores.
     """
-    tokenized_strings = [tokenize(s) for s in strings] + [tokenize(comparison_string)]
-    vectors = [vectorize_with_hashing(tokens, vector_size) for tokens in tokenized_strings]
-    comparison_vector = vectors[-1]
-    similarities = [cosine_similarity(vector, comparison_vector) for vector in vectors[:-1]]
+    tokenized_strings = tokenize_all(strings + [comparison_string])
+    vectors = vectorize_corpus_with_hashing(tokenized_strings, vector_size)
+    # score every string against the comparison string with one matrix-vector product
+    matrix = vectors[:-1].astype(np.float32)
+    comparison_vector = vectors[-1].astype(np.float32)
+    norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(comparison_vector)
+    similarities = ((matrix @ comparison_vector) / norms).tolist()
     
     return similarities
 
@@ -189,8 +255,9 @@ for compare in comparison_strings:
     index_of_best_match = similarities.index(max(similarities))
     print(f"{compare}\n({similarities[index_of_best_match]}) {strings[index_of_best_match]}\n")
 
-firewall_1 = CityHash32("attempted") % 1024
-firewall_2 = int(firewall_1 * 1.618033988749895) % 1024
+firewall_hash = np.array([CityHash32("attempted")], dtype=np.uint32)
+firewall_1 = int(firewall_hash[0]) % 1024
+firewall_2 = int(fibonacci_index(firewall_hash, 1024)[0])
 
 hits = 0
 for s in strings:
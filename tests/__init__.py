@@ -1,5 +1,6 @@
 def run_tests():
     import contextlib
+    import functools
     import inspect
     from io import StringIO
     import shutil
@@ -13,16 +14,28 @@ def run_tests():
     test_methods = []
     for name, obj in inspect.getmembers(caller_module):
         if inspect.isfunction(obj) and name.startswith("test_"):
-            test_methods.append(obj)
+            # expand pytest.mark.parametrize into one test per case
+            parametrize = [
+                mark for mark in getattr(obj, "pytestmark", []) if mark.name == "parametrize"
+            ]
+            if not parametrize:
+                test_methods.append((name, obj))
+                continue
+            argnames, argvalues = parametrize[0].args[:2]
+            for values in argvalues:
+                if isinstance(argnames, str) and "," not in argnames:
+                    values = (values,)
+                case = "-".join(map(str, values))
+                test_methods.append((f"{name}[{case}]", functools.partial(obj, *values)))
 
     print(f"\n\033[38;2;139;233;253m\033[3mRUNNING SET OF {len(test_methods)} TESTS\033[0m\n")
 
     passed = 0
     failed = 0
 
-    for index, method in enumerate(test_methods):
+    for index, (method_name, method) in enumerate(test_methods):
         start_time = time.monotonic_ns()
-        test_name = f"\033[38;2;255;184;108m{(index + 1):04}\033[0m \033[38;2;189;147;249m{str(method.__name__)}\033[0m"
+        test_name = f"\033[38;2;255;184;108m{(index + 1):04}\033[0m \033[38;2;189;147;249m{method_name}\033[0m"
         print(test_name.ljust(display_width - 20), end="", flush=True)
         error = None
         output = ""
@@ -140,6 +140,21 @@ def test_opteryx_arrow_medium():
     assert fake2.shape == (100000, 100)
 
 
+def test_ipc_round_trip():
+    df = DataFrame(
+        [{"id": 1, "name": "Alice"}, {"id": 2, "name": "Bob"}, {"id": 3, "name": None}]
+    )
+
+    data = df.ipc()
+    assert isinstance(data, bytes)
+
+    restored = DataFrame.from_ipc(data)
+    assert restored.column_names == ("id", "name")
+    assert restored.fetchall() == [(1, "Alice"), (2, "Bob"), (3, None)]
+
+    assert len(DataFrame.from_ipc(df.ipc(size=2))) == 2
+
+
 if __name__ == "__main__":  # prgama: nocover
     from tests import run_tests
 
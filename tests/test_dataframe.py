@@ -325,6 +325,54 @@ def test_appending():
         )
 
 
+def test_extending():
+    df = ossis.DataFrame(schema=["name", "population"])
+    df.extend([("Perth", 2059484), ("Hobart", 240342)])
+    df.extend(row for row in [("Darwin", 147255)])
+    assert len(df) == 3
+    assert df.row(2).as_dict == {"name": "Darwin", "population": 147255}
+
+    df = ossis.DataFrame(schema=cities.schema)
+    df.extend(
+        [
+            {
+                "name": "Perth",
+                "population": 2059484,
+                "country": "Australia",
+                "founded": "1829",
+                "area": 6412.3,
+                "language": "English",
+            }
+        ]
+    )
+    assert len(df) == 1
+    # records are still validated against the schema
+    with pytest.raises(DataValidationError):
+        df.extend(
+            [
+                {
+                    "name": "Darwin",
+                    "population": 147255,
+                    "country": None,
+                    "founded": "1869",
+                    "area": 112.01,
+                    "language": "English",
+                }
+            ]
+        )
+
+
+def test_clearing():
+    df = ossis.DataFrame(schema=["name", "population"])
+    df.extend([("Perth", 2059484), ("Hobart", 240342)])
+    df.clear()
+    assert len(df) == 0
+    assert df.column_names == ("name", "population")
+    df.extend([("Darwin", 147255)])
+    assert len(df) == 1
+    assert df.row(0).as_dict == {"name": "Darwin", "population": 147255}
+
+
 def test_describe():
     df = create_dataframe()
     desc = df.description
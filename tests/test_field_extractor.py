@@ -4,8 +4,11 @@ import sys
 sys.path.insert(1, os.path.join(sys.path[0], ".."))
 
 from ossis.compute.compiled import extract_dict_columns
+from ossis.compute.compiled import extract_dict_columns_batch
 import random
 
+import pytest
+
 def test_extract_dict_columns_basic():
     data = {'a': 1, 'b': 2, 'c': 3}
     fields = ('a', 'b', 'c')
@@ -215,6 +218,23 @@ def test_extract_dict_columns_large_dataset_with_missing():
     result = extract_dict_columns(data, fields)
     assert result == (None, 500000, 999999)
 
+def test_extract_dict_columns_batch():
+    rows = [{'a': 1, 'b': 2}, {'b': 3, 'c': 4}, {}]
+    fields = ('a', 'b')
+    result = extract_dict_columns_batch(rows, fields)
+    assert result == [(1, 2), (None, 3), (None, None)]
+    assert result == [extract_dict_columns(row, fields) for row in rows]
+
+def test_extract_dict_columns_batch_empty():
+    assert extract_dict_columns_batch([], ('a',)) == []
+    assert extract_dict_columns_batch([{'a': 1}], ()) == [()]
+
+def test_extract_dict_columns_batch_rejects_non_dict_rows():
+    with pytest.raises(TypeError):
+        extract_dict_columns_batch([{'a': 1}, ['a', 1]], ('a',))
+    with pytest.raises(TypeError):
+        extract_dict_columns_batch([None], ('a',))
+
 if __name__ == "__main__":  # prgama: nocover
     from tests import run_tests
 
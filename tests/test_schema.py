@@ -21,6 +21,57 @@ def test_find_column():
     assert column is None, column
 
 
+def test_find_column_after_changes():
+    schema = RelationSchema(
+        name="find", columns=[FlatColumn(name="a", aliases=["alpha"]), FlatColumn(name="b")]
+    )
+    assert schema.find_column("alpha").name == "a"
+    assert schema.find_column("ALPHA", case_insensitive=True).name == "a"
+    assert schema.find_column("ALPHA") is None
+
+    # columns changed in place after a lookup are still found by their new names
+    schema.columns[1].name = "beta"
+    assert schema.find_column("b") is None
+    assert schema.find_column("beta").name == "beta"
+    schema.columns[0].aliases = ["first"]
+    assert schema.find_column("alpha") is None
+    assert schema.find_column("First", case_insensitive=True).name == "a"
+
+    schema.columns.append(FlatColumn(name="c"))
+    assert schema.find_column("c").name == "c"
+    schema.pop_column("c")
+    assert schema.find_column("c") is None
+
+
+def test_find_column_after_replacing_columns():
+    schema = RelationSchema(
+        name="find", columns=[FlatColumn(name="a", type="VARCHAR"), FlatColumn(name="b")]
+    )
+    assert schema.find_column("a").type == ossisTypes.VARCHAR
+
+    # a column replaced in place is found rather than the column it replaced
+    schema.columns[0] = FlatColumn(name="a", type="INTEGER")
+    assert schema.find_column("a") is schema.columns[0]
+    assert schema.column("a").type == ossisTypes.INTEGER
+
+    # a column renamed or given an alias in place is found by its new names
+    schema.columns[1].name = "d"
+    assert schema.find_column("b") is None
+    assert schema.find_column("d") is schema.columns[1]
+    schema.columns[0].aliases.append("e")
+    assert schema.find_column("E", case_insensitive=True) is schema.columns[0]
+
+    # a column removed in place is no longer found
+    del schema.columns[0]
+    assert schema.find_column("a") is None
+    assert schema.find_column("d") is schema.columns[0]
+
+    # a new list of columns is always looked up afresh
+    schema.columns = [FlatColumn(name="c")]
+    assert schema.find_column("a") is None
+    assert schema.find_column("c") is schema.columns[0]
+
+
 def test_all_column_names():
     column_names = cities.schema.all_column_names()
     assert "name" in column_names
@@ -149,6 +200,62 @@ def test_validate_with_multiple_errors():
     assert "area" in str(err)
 
 
+def test_validate_after_changing_columns():
+    schema = RelationSchema(
+        name="validate", columns=[FlatColumn(name="a", type="INTEGER", nullable=True)]
+    )
+    assert schema.validate({"a": None})
+
+    # the precompiled checks follow changes made to the columns
+    schema.columns[0].nullable = False
+    with pytest.raises(DataValidationError):
+        schema.validate({"a": None})
+
+    schema.columns.append(FlatColumn(name="b", type="VARCHAR"))
+    assert schema.validate({"a": 1, "b": "one"})
+    with pytest.raises(DataValidationError) as err:
+        schema.validate({"a": 1})
+    assert "b" in str(err)
+
+
+def test_schema_pickles():
+    import pickle
+
+    restored = pickle.loads(pickle.dumps(cities.schema))
+    assert restored.column_names == cities.schema.column_names
+    assert restored.validate(
+        {
+            "name": "Perth",
+            "population": 2059484,
+            "country": "Australia",
+            "founded": "1829",
+            "area": 6412.3,
+            "language": "English",
+        }
+    )
+
+
+def test_validate_batch():
+    valid = {
+        "name": "Perth",
+        "population": 2059484,
+        "country": "Australia",
+        "founded": "1829",
+        "area": 6412.3,
+        "language": "English",
+    }
+    assert cities.schema.validate_batch([valid, dict(valid, founded=None)])
+    assert cities.schema.validate_batch([])
+
+    with pytest.raises(DataValidationError) as err:
+        cities.schema.validate_batch([valid, dict(valid, area="6412.3")])
+    assert "area" in str(err)
+    with pytest.raises(ExcessColumnsInDataError):
+        cities.schema.validate_batch([dict(valid, continent="Oceania")])
+    with pytest.raises(TypeError):
+        cities.schema.validate_batch([valid, [1, 2, 3]])
+
+
 def test_validate_with_invalid_data_type():
     # Test with invalid data type (not a MutableMapping)
     data = [1, 2, 3]
@@ -184,6 +184,17 @@ def test_field_to_column():
     assert column.fields[0].type == ossisTypes.INTEGER
 
 
+def test_field_to_column_leaves_types_untouched():
+    column = FlatColumn.from_arrow(pyarrow.field("test", pyarrow.list_(pyarrow.string())))
+    assert column.element_type == ossisTypes.VARCHAR
+    assert ossisTypes.ARRAY._element_type is None
+
+    column = FlatColumn.from_arrow(pyarrow.field("test", pyarrow.decimal128(10, 2)))
+    assert (column.precision, column.scale) == (10, 2)
+    assert ossisTypes.DECIMAL._precision is None
+    assert ossisTypes.DECIMAL._scale is None
+
+
 def test_ossis_types_to_arrow():
     # DECIMAL with explicit precision/scale
     dt = ossisTypes.DECIMAL.to_arrow(precision=28, scale=21)
@@ -193,6 +204,14 @@ def test_ossis_types_to_arrow():
     at = ossisTypes.ARRAY.to_arrow(element_type=ossisTypes.INTEGER)
     assert at == pyarrow.list_(pyarrow.int64())
 
+    # element types can be given by name, unknown names fall back to strings
+    assert ossisTypes.ARRAY.to_arrow(element_type="INT8") == pyarrow.list_(pyarrow.int8())
+    assert ossisTypes.ARRAY.to_arrow(element_type="apples") == pyarrow.list_(pyarrow.string())
+
+    # repeated conversions reuse the same type objects
+    assert ossisTypes.DECIMAL.to_arrow(precision=28, scale=21) is dt
+    assert ossisTypes.ARRAY.to_arrow(element_type=ossisTypes.INTEGER) is at
+
 
 if __name__ == "__main__":  # prgama: nocover
     from tests import run_tests
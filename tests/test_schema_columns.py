@@ -228,6 +228,7 @@ def test_dict_column():
 
     assert sorted(dict_column.values) == ["28", "30", "31"]
     assert list(dict_column.encoding) == [2, 0, 2, 1, 2, 1, 2, 2, 1, 2, 1, 2]
+    assert dict_column.encoding.dtype == numpy.uint8
 
     values = dict_column.materialize()
 
@@ -269,10 +270,23 @@ def test_sparse_column():
 import numpy
 
 
+def test_virtual_columns_have_no_instance_dict():
+    columns = [
+        ConstantColumn(name="constant", value=1),
+        DictionaryColumn(name="dictionary", values=[1, 2, 1]),
+        FunctionColumn(name="function", binding=lambda: 1),
+        RLEColumn(name="rle", values=[1, 1, 2]),
+        SparseColumn(name="sparse", values=[1, None, None]),
+    ]
+    for column in columns:
+        assert not hasattr(column, "__dict__"), column.__class__.__name__
+
+
 def test_sparse_column_multiply():
     # Initialize the sparse column
     original_values = [1, None, 2, None, None, 3, 4, 5, None]
     sparse_col = SparseColumn(name="test", type=ossisTypes.INTEGER, values=original_values)
+    assert sparse_col.values.dtype == numpy.int64
 
     # Perform the operation on compressed values
     sparse_col.values = sparse_col.values * 2
@@ -287,6 +301,22 @@ def test_sparse_column_multiply():
     numpy.testing.assert_array_equal(materialized_values, expected_values_np)
 
 
+def test_sparse_column_mixed_numbers_are_not_coerced():
+    # mixed ints and floats stay as they are rather than being cast to a common type
+    sparse_col = SparseColumn(name="mixed", type=ossisTypes.DOUBLE, values=[2**53 + 1, None, 0.5])
+    assert sparse_col.values.dtype == object
+    materialized_values = sparse_col.materialize()
+    assert materialized_values[0] == 2**53 + 1
+    assert type(materialized_values[0]) is int
+    assert materialized_values[1] is None
+    assert materialized_values[2] == 0.5
+
+    materialized_values = SparseColumn(
+        name="mixed", type=ossisTypes.DOUBLE, values=[1.5, None, 2]
+    ).materialize()
+    assert type(materialized_values[2]) is int
+
+
 # Constant Column Test
 def test_constant_column_multiply():
     constant_col = ConstantColumn(name="const", type=ossisTypes.INTEGER, length=5, value=3)
@@ -421,6 +451,44 @@ def test_arrow_conversion():
     print(_arrow_schema)
 
 
+def test_cached_arrow_schema():
+    from ossis.schema import RelationSchema
+
+    schema = RelationSchema(
+        name="fruit",
+        columns=[
+            FlatColumn(name="name", type=ossisTypes.VARCHAR),
+            FlatColumn(name="count", type=ossisTypes.INTEGER),
+        ],
+    )
+
+    arrow_schema = schema.arrow_schema
+    assert arrow_schema.names == ["name", "count"]
+    assert schema.arrow_schema is arrow_schema
+
+    schema.columns[1].type = ossisTypes.DOUBLE
+    schema.columns[1].nullable = False
+    assert schema.arrow_schema.field("count").type == pyarrow.float64()
+    assert not schema.arrow_schema.field("count").nullable
+
+    schema.columns.append(FlatColumn(name="ripe", type=ossisTypes.BOOLEAN))
+    assert schema.arrow_schema.names == ["name", "count", "ripe"]
+
+
+def test_arrow_c_schema():
+    from ossis.schema import RelationSchema
+
+    schema = RelationSchema(
+        name="fruit",
+        columns=[
+            FlatColumn(name="name", type=ossisTypes.VARCHAR),
+            FlatColumn(name="count", type=ossisTypes.INTEGER, nullable=False),
+        ],
+    )
+
+    assert pyarrow.schema(schema) == schema.arrow_schema
+
+
 if __name__ == "__main__":  # prgama: nocover
     from tests import run_tests
 
@@ -9,6 +9,9 @@ import numpy
 import pandas
 
 from ossis.tools import parse_iso
+from ossis.tools import parse_iso_column
+from ossis.tools import parse_iso_compiled
+from ossis.tools import parse_iso_into
 
 # fmt:off
 DATE_TESTS = [
@@ -43,6 +46,74 @@ def test_date_parser(string, expect):
     assert parse_iso(string) == expect, f"in:{string}  res:{parse_iso(string)} exp:{expect}"
 
 
+@pytest.mark.parametrize("string, expect", DATE_TESTS)
+def test_compiled_date_parser(string, expect):
+    parser = parse_iso_compiled(string)
+    assert parser(string) == expect, f"in:{string}  res:{parser(string)} exp:{expect}"
+
+
+def test_compiled_date_parser_mixed_types():
+    parser = parse_iso_compiled("2021-02-21")
+    assert parser("2021-02-21 10:11") == datetime.datetime(2021, 2, 21, 10, 11)
+    assert parser("not a date") is None
+    assert parser(b"2021-02-21") == datetime.datetime(2021, 2, 21)
+    assert parser(datetime.date(2021, 2, 21)) == datetime.datetime(2021, 2, 21)
+    assert parser(None) is None
+
+    parser = parse_iso_compiled(None)
+    assert parser("2021-02-21") == datetime.datetime(2021, 2, 21)
+
+
+def test_column_date_parser():
+    import pyarrow
+
+    strings = [s for s, _ in DATE_TESTS if isinstance(s, str)]
+    expected = [parse_iso(s) for s in strings]
+
+    # mixed formats and unparseable values are handled value by value
+    assert parse_iso_column(pyarrow.array(strings)).to_pylist() == expected
+
+    # clean columns are converted by arrow
+    clean = ["2021-02-21", "2021-01-11 12:00", "1999-12-31T23:59:59.9999Z", None]
+    parsed = parse_iso_column(pyarrow.chunked_array([clean, clean]))
+    assert parsed.type == pyarrow.timestamp("us")
+    assert parsed.to_pylist() == [parse_iso(s) for s in clean] * 2
+
+
+def test_date_parser_into_buffers():
+    import pyarrow
+
+    values = [
+        "2021-02-21",
+        "not a date",
+        1700000000,
+        None,
+        "1969-12-31 23:59:59",
+        datetime.datetime(2021, 2, 21, 1, tzinfo=datetime.timezone(datetime.timedelta(hours=1))),
+    ]
+    timestamps = numpy.zeros(len(values), dtype=numpy.int64)
+    validity = numpy.zeros((len(values) + 7) >> 3, dtype=numpy.uint8)
+
+    for index, value in enumerate(values):
+        parse_iso_into(timestamps, validity, index, value)
+
+    assert validity[0] == 0b110101
+    assert timestamps[0] == numpy.datetime64("2021-02-21", "us").astype(numpy.int64)
+    assert timestamps[2] == 1700000000 * 1_000_000
+    assert timestamps[4] == -1_000_000
+    # aware values are stored in UTC
+    assert timestamps[5] == timestamps[0]
+
+    # the buffers are an arrow timestamp array, with nulls where values didn't parse
+    array = pyarrow.Array.from_buffers(
+        pyarrow.timestamp("us"),
+        len(values),
+        [pyarrow.py_buffer(validity), pyarrow.py_buffer(timestamps)],
+    )
+    assert array.null_count == 2
+    assert array.to_pylist()[:3] == [datetime.datetime(2021, 2, 21), None, parse_iso(1700000000)]
+
+
 if __name__ == "__main__":  # pragma: no cover
     print(f"RUNNING BATTERY OF {len(DATE_TESTS)} DATE TESTS")
     for date_string, date_date in DATE_TESTS:
@@ -3,55 +3,42 @@ import sys
 
 sys.path.insert(1, os.path.join(sys.path[0], ".."))
 
+import pytest
+
 from ossis.types import ossisTypes
 
 
-def test_types_is_numeric():
-    # is numeric
-    assert not ossisTypes.ARRAY.is_numeric()
-    assert not ossisTypes.BLOB.is_numeric()
-    assert ossisTypes.BOOLEAN.is_numeric()
-    assert not ossisTypes.DATE.is_numeric()
-    assert ossisTypes.DECIMAL.is_numeric()
-    assert ossisTypes.DOUBLE.is_numeric()
-    assert ossisTypes.INTEGER.is_numeric()
-    assert not ossisTypes.INTERVAL.is_numeric()
-    assert not ossisTypes.STRUCT.is_numeric()
-    assert not ossisTypes.TIME.is_numeric()
-    assert not ossisTypes.TIMESTAMP.is_numeric()
-    assert not ossisTypes.VARCHAR.is_numeric()
-
-
-def test_types_is_temporal():
-    # is temporal
-    assert not ossisTypes.ARRAY.is_temporal()
-    assert not ossisTypes.BLOB.is_temporal()
-    assert not ossisTypes.BOOLEAN.is_temporal()
-    assert ossisTypes.DATE.is_temporal()
-    assert not ossisTypes.DECIMAL.is_temporal()
-    assert not ossisTypes.DOUBLE.is_temporal()
-    assert not ossisTypes.INTEGER.is_temporal()
-    assert not ossisTypes.INTERVAL.is_temporal()
-    assert not ossisTypes.STRUCT.is_temporal()
-    assert ossisTypes.TIME.is_temporal()
-    assert ossisTypes.TIMESTAMP.is_temporal()
-    assert not ossisTypes.VARCHAR.is_temporal()
-
-
-def test_types_is_large_object():
-    # is temporal
-    assert not ossisTypes.ARRAY.is_large_object()
-    assert ossisTypes.BLOB.is_large_object()
-    assert not ossisTypes.BOOLEAN.is_large_object()
-    assert not ossisTypes.DATE.is_large_object()
-    assert not ossisTypes.DECIMAL.is_large_object()
-    assert not ossisTypes.DOUBLE.is_large_object()
-    assert not ossisTypes.INTEGER.is_large_object()
-    assert not ossisTypes.INTERVAL.is_large_object()
-    assert not ossisTypes.STRUCT.is_large_object()
-    assert not ossisTypes.TIME.is_large_object()
-    assert not ossisTypes.TIMESTAMP.is_large_object()
-    assert ossisTypes.VARCHAR.is_large_object()
+# type, is_numeric, is_temporal, is_large_object
+TYPE_PREDICATES = [
+    (ossisTypes.ARRAY, False, False, False),
+    (ossisTypes.BLOB, False, False, True),
+    (ossisTypes.BOOLEAN, True, False, False),
+    (ossisTypes.DATE, False, True, False),
+    (ossisTypes.DECIMAL, True, False, False),
+    (ossisTypes.DOUBLE, True, False, False),
+    (ossisTypes.INTEGER, True, False, False),
+    (ossisTypes.INTERVAL, False, False, False),
+    (ossisTypes.STRUCT, False, False, False),
+    (ossisTypes.TIME, False, True, False),
+    (ossisTypes.TIMESTAMP, False, True, False),
+    (ossisTypes.VARCHAR, False, False, True),
+]
+
+
+@pytest.mark.parametrize("_type,numeric,temporal,large_object", TYPE_PREDICATES)
+def test_types_is_numeric(_type, numeric, temporal, large_object):
+    assert _type.is_numeric() is numeric
+
+
+@pytest.mark.parametrize("_type,numeric,temporal,large_object", TYPE_PREDICATES)
+def test_types_is_temporal(_type, numeric, temporal, large_object):
+    assert _type.is_temporal() is temporal
+
+
+@pytest.mark.parametrize("_type,numeric,temporal,large_object", TYPE_PREDICATES)
+def test_types_is_large_object(_type, numeric, temporal, large_object):
+    assert _type.is_large_object() is large_object
+
 
 def test_types_python_type():
     # don't need to test them all to provide the code
@@ -1,5 +1,7 @@
 import datetime
 import decimal
+import numpy
+import pyarrow
 import pytest
 import sys
 
@@ -138,9 +140,16 @@ CAST_TESTS = [
     ("ARRAY<INTEGER>", "[1, null, 3]", [1, None, 3]),
     ("ARRAY<INTEGER>", None, None),
     ("ARRAY<INTEGER>", [], []),
+    ("ARRAY<INTEGER>", numpy.array([1, 2, 3]), [1, 2, 3]),
+    ("ARRAY<INTEGER>", pyarrow.scalar([1, None, 3], pyarrow.list_(pyarrow.int64())), [1, None, 3]),
+    ("ARRAY<INTEGER>", pyarrow.scalar(None, pyarrow.list_(pyarrow.int64())), None),
+    ("ARRAY<VARCHAR>", pyarrow.scalar([1, 2], pyarrow.list_(pyarrow.int64())), ["1", "2"]),
 
     ("ARRAY<DOUBLE>", [1.1, 2.2, 3.3], [1.1, 2.2, 3.3]),
     ("ARRAY<DOUBLE>", "[1.1, 2.2, 3.3]", [1.1, 2.2, 3.3]),
+    ("ARRAY<FLOAT16>", numpy.array([1.1, 2.5, 65520.0]), [1.099609375, 2.5, float("inf")]),
+    ("ARRAY<FLOAT16>", pyarrow.scalar([1, 2], pyarrow.list_(pyarrow.int64())), [1.0, 2.0]),
+    ("ARRAY<FLOAT32>", numpy.array([1.1, 2.5]), [1.100000023841858, 2.5]),
 
     ("ARRAY<BOOLEAN>", [True, False, True], [True, False, True]),
     ("ARRAY<BOOLEAN>", '["true", "false", "yes"]', [True, False, True]),
@@ -163,6 +172,20 @@ def test_ossis_type_parsers(type_name, input_value, expected):
     assert value == expected, f"{type_name} parsing of {input_value} returned {value}, expected {expected}"
 
 
+ARRAY_REJECTED_INPUTS = [
+    ("ARRAY<INTEGER>", numpy.int64(7)),
+    ("ARRAY<FLOAT32>", numpy.float64(1.5)),
+    ("ARRAY<INTEGER>", numpy.array([[1, 2], [3, 4]])),
+    ("ARRAY<FLOAT32>", numpy.array([[1.5, 2.5], [3.5, 4.5]])),
+]
+
+@pytest.mark.parametrize("type_name,input_value", ARRAY_REJECTED_INPUTS)
+def test_array_parser_rejects_numpy_scalars_and_nd_arrays(type_name, input_value):
+    _type, _length, _precision, _scale, _element_type = ossisTypes.from_name(type_name)
+    # as before numpy arrays were accepted, these fail to decode as JSON
+    with pytest.raises(ValueError):
+        _type.parse(input_value, element_type=_element_type)
+
 
 BOOLEAN_STRINGS = ("TRUE", "ON", "YES", "1", "1.0", b"TRUE", b"ON", b"YES", b"1", b"1.0")
 bp = lambda x: str(x).upper() in BOOLEAN_STRINGS
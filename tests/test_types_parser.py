@@ -11,10 +11,11 @@ to ossisType enum values, with comprehensive coverage of:
 
 import os
 import sys
-from contextlib import suppress
 
 sys.path.insert(1, os.path.join(sys.path[0], ".."))
 
+import pytest
+
 from ossis.types import get_ossis_type, ossisTypes
 
 
@@ -142,27 +143,23 @@ def test_lowercase_decimal():
 
 def test_invalid_type_raises_error():
     """Test that invalid type raises ValueError"""
-    try:
+    with pytest.raises(ValueError, match="Unknown"):
         get_ossis_type("INVALID_TYPE")
-        assert False, "Should have raised ValueError"
-    except ValueError as e:
-        assert "Unknown" in str(e)
 
 def test_empty_array_raises_error():
     """Test that empty ARRAY type raises ValueError"""
-    try:
+    with pytest.raises(ValueError):
         get_ossis_type("ARRAY<>")
-        assert False, "Should have raised ValueError"
-    except ValueError:
-        pass  # Expected
 
 def test_nonexistent_array_element_type():
     """Test that invalid element type in ARRAY might raise ValueError or be accepted"""
     # The parser may accept unknown array element types without validation
-    with suppress(ValueError):
+    try:
         result = get_ossis_type("ARRAY<NONEXISTENT>")
         # If it doesn't raise, the ARRAY type is still returned
         assert result == ossisTypes.ARRAY
+    except ValueError:
+        pass
 
 
 def test_decimal_precision_scale_attached():
@@ -202,6 +199,36 @@ def test_array_varchar_element_type_attached():
     assert result == ossisTypes.ARRAY
     assert result._element_type == ossisTypes.VARCHAR
 
+def test_parameters_not_attached_to_enum_member():
+    """Test that resolving a parameterised type leaves the enum member unchanged"""
+    first = get_ossis_type("VARCHAR[10]")
+    second = get_ossis_type("VARCHAR[20]")
+    assert first._length == 10
+    assert second._length == 20
+    assert ossisTypes.VARCHAR._length is None
+    assert str(ossisTypes.VARCHAR) == "VARCHAR"
+
+def test_resolved_types_do_not_depend_on_call_order():
+    """Test that a resolved type isn't confused with its bare member in cached lookups"""
+    import warnings
+
+    from ossis.schema import FlatColumn
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        ossisTypes.from_name(ossisTypes.ARRAY)
+    column = FlatColumn(name="numbers", type=get_ossis_type("ARRAY<INTEGER>"))
+    assert column.element_type == ossisTypes.INTEGER
+
+    ossisTypes.from_name(ossisTypes.VARCHAR)
+    column = FlatColumn(name="code", type=get_ossis_type("VARCHAR[12]"))
+    assert column.type == ossisTypes.VARCHAR
+    assert column.length == 12
+
+    # equality is on the base member, so it is transitive
+    decimals = {get_ossis_type("DECIMAL(10,2)"), get_ossis_type("DECIMAL(5,1)"), ossisTypes.DECIMAL}
+    assert len(decimals) == 1
+
 def test_simple_type_has_none_metadata():
     """Test that simple types like INTEGER have None metadata"""
     result = get_ossis_type("INTEGER")
@@ -239,29 +266,35 @@ def test_type_string_with_whitespace():
 
 def test_multiple_nested_arrays_not_supported():
     """Test that nested arrays raise appropriate error"""
-    with suppress(ValueError):
+    try:
         get_ossis_type("ARRAY<ARRAY<INTEGER>>")
-
-def test_all_ossis_types_are_parseable():
+    except ValueError:
+        pass
+
+ALL_TYPE_NAMES = [
+    "ARRAY",
+    "BLOB",
+    "BOOLEAN",
+    "DATE",
+    "DECIMAL",
+    "DOUBLE",
+    "INTEGER",
+    "INTERVAL",
+    "STRUCT",
+    "TIMESTAMP",
+    "TIME",
+    "VARCHAR",
+    "JSONB",
+]
+
+
+@pytest.mark.parametrize("type_name", ALL_TYPE_NAMES)
+def test_all_ossis_types_are_parseable(type_name):
     """Test that all ossisTypes enum values can be parsed as strings"""
-    for type_name in [
-        "ARRAY",
-        "BLOB",
-        "BOOLEAN",
-        "DATE",
-        "DECIMAL",
-        "DOUBLE",
-        "INTEGER",
-        "INTERVAL",
-        "STRUCT",
-        "TIMESTAMP",
-        "TIME",
-        "VARCHAR",
-        "JSONB",
-    ]:
-        result = get_ossis_type(type_name)
-        assert result is not None
-        assert isinstance(result, ossisTypes)
+    result = get_ossis_type(type_name)
+    assert result is not None
+    assert isinstance(result.base, ossisTypes)
+    assert result.base is ossisTypes[type_name]
 
 
 if __name__ == "__main__":